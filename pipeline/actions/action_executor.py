@@ -1,21 +1,89 @@
+import json
+import time
+import atexit
 import logging
+import threading
+from collections import OrderedDict, deque
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Executors for explicit configs, keyed by identity; the config is kept
+# alongside so its id cannot be reused while the entry is cached
+_EXECUTOR_CACHE_SIZE = 8
+_executor_cache: "OrderedDict[int, tuple]" = OrderedDict()
+_default_executor: Optional["ActionExecutor"] = None
+_executor_lock = threading.Lock()
+
+# One pending queue, flush lock and flush thread per history file, shared by executors
+_history_queues: Dict[str, deque] = {}
+_history_flush_locks: Dict[str, threading.Lock] = {}
+_history_queues_lock = threading.Lock()
+
+def _history_queue(path: str, interval: float) -> deque:
+    with _history_queues_lock:
+        pending = _history_queues.get(path)
+        if pending is None:
+            if not _history_queues:
+                atexit.register(_flush_all_history)
+            pending = _history_queues[path] = deque()
+            _history_flush_locks[path] = threading.Lock()
+            threading.Thread(target=_flush_loop, args=(path, interval), daemon=True).start()
+        return pending
+
+def _flush_history(path: str):
+    pending = _history_queues.get(path)
+    if pending is None:
+        return
+    
+    # The flush thread and the atexit hook may both flush the same path; waiting
+    # on the lock even when the queue looks empty lets a batch in flight land first
+    with _history_flush_locks[path]:
+        batch = []
+        while True:
+            try:
+                batch.append(pending.popleft())
+            except IndexError:
+                break
+        if not batch:
+            return
+        
+        try:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.writelines(json.dumps(entry, default=str, ensure_ascii=False) + "\n" for entry in batch)
+        except Exception as e:
+            # Keep the entries for the next flush instead of dropping them
+            pending.extendleft(reversed(batch))
+            logger.error("Failed to persist %d action history entries to %s: %s", len(batch), path, e)
+
+def _flush_all_history():
+    for path in list(_history_queues):
+        _flush_history(path)
+
+def _flush_loop(path: str, interval: float):
+    while True:
+        time.sleep(interval)
+        _flush_history(path)
+
 class ActionExecutor:
     def __init__(self, config=None):
         self.config = config or {}
         self.safe_mode = self.config.get('safe_mode', True)
-        self.action_history = []
+        self.action_history = deque(maxlen=100)
+        self.history_path = self.config.get('action_history_path')
+        self.history_flush_interval = self.config.get('action_history_flush_interval', 0.5)
+        self._pending_history = None
+        
+        if self.history_path:
+            self._pending_history = _history_queue(self.history_path, self.history_flush_interval)
         
         try:
             from pipeline.actions.action_router import ActionRouter
             self.router = ActionRouter(config=self.config)
             logger.info("ActionExecutor initialized")
         except Exception as e:
-            logger.error(f"Failed to initialize ActionRouter: {e}")
+            logger.error("Failed to initialize ActionRouter: %s", e)
             self.router = None
     
     def execute_action(self, intent: str, entities: Dict[str, Any], context: Optional[Dict] = None) -> Dict[str, Any]:
@@ -27,24 +95,26 @@ class ActionExecutor:
             }
         
         try:
-            logger.info(f"Executing action for intent: {intent}")
-            logger.debug(f"Entities: {entities}")
+            logger.info("Executing action for intent: %s", intent)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Entities: %s", entities)
             
             result = self.router.route(intent, entities, context)
             
-            self.action_history.append({
+            entry = {
                 "intent": intent,
                 "entities": entities,
                 "result": result
-            })
+            }
+            self.action_history.append(entry)
             
-            if len(self.action_history) > 100:
-                self.action_history = self.action_history[-100:]
+            if self._pending_history is not None:
+                self._pending_history.append(entry)
             
             return result
         
         except Exception as e:
-            logger.error(f"Action execution failed: {e}")
+            logger.error("Action execution failed: %s", e)
             return {
                 "status": "error",
                 "message": f"Failed to execute action: {str(e)}",
@@ -52,12 +122,36 @@ class ActionExecutor:
             }
     
     def get_history(self, limit: int = 10) -> list:
-        return self.action_history[-limit:]
+        return list(self.action_history)[-limit:]
+    
+    def flush_history(self):
+        if self.history_path:
+            _flush_history(self.history_path)
     
     def clear_history(self):
-        self.action_history = []
+        self.action_history.clear()
         logger.info("Action history cleared")
 
+def get_executor(config: Optional[Dict] = None) -> ActionExecutor:
+    global _default_executor
+    with _executor_lock:
+        if not config:
+            if _default_executor is None:
+                _default_executor = ActionExecutor()
+            return _default_executor
+        
+        key = id(config)
+        cached = _executor_cache.get(key)
+        if cached is not None:
+            _executor_cache.move_to_end(key)
+            return cached[1]
+        
+        executor = ActionExecutor(config=config)
+        _executor_cache[key] = (config, executor)
+        if len(_executor_cache) > _EXECUTOR_CACHE_SIZE:
+            _executor_cache.popitem(last=False)
+        return executor
+
 def execute_action_from_dm(dm_output: Dict[str, Any], config: Optional[Dict] = None) -> Dict[str, Any]:
     if not dm_output.get('should_act', False):
         return {
@@ -66,7 +160,7 @@ def execute_action_from_dm(dm_output: Dict[str, Any], config: Optional[Dict] = N
             "data": {}
         }
     
-    executor = ActionExecutor(config=config)
+    executor = get_executor(config)
     
     intent = dm_output.get('action', '')
     entities = dm_output.get('entities', {})
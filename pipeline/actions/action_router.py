@@ -1,48 +1,59 @@
+import importlib
 import logging
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Callable
 
+from pipeline.actions.registry import get_registered
+
 logger = logging.getLogger(__name__)
 
+_MODULES = "pipeline.actions.modules."
+
 class ActionRouter:
+    _CLASS_ACTION_MAP = MappingProxyType({
+        "OPEN_APP": _MODULES + "open_app_action",
+        "OPEN_WEBSITE": _MODULES + "open_website_action",
+        "PLAY_MUSIC": _MODULES + "play_media_action",
+        "PLAY_MEDIA": _MODULES + "play_media_action",
+        "VOLUME_UP": _MODULES + "volume_control_action",
+        "VOLUME_DOWN": _MODULES + "volume_control_action",
+        "VOLUME_SET": _MODULES + "volume_control_action",
+        "BRIGHTNESS_UP": _MODULES + "brightness_control_action",
+        "BRIGHTNESS_DOWN": _MODULES + "brightness_control_action",
+        "BRIGHTNESS_SET": _MODULES + "brightness_control_action",
+        "OPEN_FILE": _MODULES + "open_file_action",
+        "OPEN_FOLDER": _MODULES + "open_file_action",
+        "SYSTEM_SHUTDOWN": _MODULES + "system_command_action",
+        "SYSTEM_RESTART": _MODULES + "system_command_action",
+        "SYSTEM_LOCK": _MODULES + "system_command_action",
+        "SYSTEM_SLEEP": _MODULES + "system_command_action",
+    })
+    
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
         self.action_map = {}
+        self._resolved: Dict[str, Callable] = {}
         self._register_actions()
     
     def _register_actions(self):
-        try:
-            from pipeline.actions.modules.open_app_action import open_app
-            from pipeline.actions.modules.open_website_action import open_website
-            from pipeline.actions.modules.play_media_action import play_media
-            from pipeline.actions.modules.volume_control_action import change_volume
-            from pipeline.actions.modules.brightness_control_action import change_brightness
-            from pipeline.actions.modules.open_file_action import open_file
-            from pipeline.actions.modules.system_command_action import execute_system_command
-            
-            self.action_map = {
-                "OPEN_APP": open_app,
-                "OPEN_WEBSITE": open_website,
-                "PLAY_MUSIC": play_media,
-                "PLAY_MEDIA": play_media,
-                "VOLUME_UP": lambda e, c: change_volume("up", e, c),
-                "VOLUME_DOWN": lambda e, c: change_volume("down", e, c),
-                "VOLUME_SET": lambda e, c: change_volume("set", e, c),
-                "BRIGHTNESS_UP": lambda e, c: change_brightness("up", e, c),
-                "BRIGHTNESS_DOWN": lambda e, c: change_brightness("down", e, c),
-                "BRIGHTNESS_SET": lambda e, c: change_brightness("set", e, c),
-                "OPEN_FILE": open_file,
-                "OPEN_FOLDER": open_file,
-                "SYSTEM_SHUTDOWN": lambda e, c: execute_system_command("shutdown", e, c),
-                "SYSTEM_RESTART": lambda e, c: execute_system_command("restart", e, c),
-                "SYSTEM_LOCK": lambda e, c: execute_system_command("lock", e, c),
-                "SYSTEM_SLEEP": lambda e, c: execute_system_command("sleep", e, c),
-                "CALL_PERSON": self._handle_call,
-            }
-            
-            logger.info(f"Registered {len(self.action_map)} actions")
+        self.action_map = dict(self._CLASS_ACTION_MAP)
+        self.action_map["CALL_PERSON"] = self._handle_call
         
-        except ImportError as e:
-            logger.error(f"Failed to import action modules: {e}")
+        self._intent_names = tuple(self.action_map)
+        self.intent_ids = {intent: i for i, intent in enumerate(self._intent_names)}
+        self._action_table = list(self.action_map.values())
+        
+        logger.info("Registered %s actions", len(self.action_map))
+    
+    def _resolve(self, intent: str, module_name: str) -> Callable:
+        action = get_registered(intent)
+        if action is None:
+            importlib.import_module(module_name)
+            action = get_registered(intent)
+        
+        if action is None:
+            raise LookupError(f"{module_name} does not register {intent}")
+        return action
     
     def _handle_call(self, entities: Dict, context: Dict) -> Dict:
         person = entities.get('person', '')
@@ -57,30 +68,62 @@ class ActionRouter:
         return open_app({"app": "whatsapp"}, context)
     
     def route(self, intent: str, entities: Dict[str, Any], context: Optional[Dict] = None) -> Dict[str, Any]:
-        context = context or {}
+        action_func = self._resolved.get(intent)
+        if action_func is not None:
+            return self._invoke(intent, action_func, entities, context or {})
+        
+        intent_id = self.intent_ids.get(intent)
         
-        if intent not in self.action_map:
-            logger.warning(f"No action registered for intent: {intent}")
+        if intent_id is None:
+            logger.warning("No action registered for intent: %s", intent)
             return {
                 "status": "error",
                 "message": f"No action available for intent: {intent}",
                 "data": {"intent": intent}
             }
         
+        return self.route_by_id(intent_id, entities, context)
+    
+    def route_by_id(self, intent_id: int, entities: Dict[str, Any], context: Optional[Dict] = None) -> Dict[str, Any]:
+        context = context or {}
+        
+        if not 0 <= intent_id < len(self._action_table):
+            return {
+                "status": "error",
+                "message": f"No action available for intent id: {intent_id}",
+                "data": {"intent_id": intent_id}
+            }
+        
+        intent = self._intent_names[intent_id]
+        action_func = self._action_table[intent_id]
+        
+        if isinstance(action_func, str):
+            try:
+                action_func = self._resolve(intent, action_func)
+            except Exception as e:
+                return self._failure(intent, e)
+            self._action_table[intent_id] = action_func
+        
+        self._resolved[intent] = action_func
+        return self._invoke(intent, action_func, entities, context)
+    
+    def _invoke(self, intent: str, action_func: Callable, entities: Dict[str, Any], context: Dict) -> Dict[str, Any]:
         try:
-            action_func = self.action_map[intent]
             result = action_func(entities, context)
             
-            logger.info(f"Action {intent} executed: {result['status']}")
+            logger.info("Action %s executed: %s", intent, result['status'])
             return result
         
         except Exception as e:
-            logger.error(f"Action routing failed for {intent}: {e}")
-            return {
-                "status": "error",
-                "message": f"Action failed: {str(e)}",
-                "data": {"error": str(e), "intent": intent}
-            }
+            return self._failure(intent, e)
+    
+    def _failure(self, intent: str, error: Exception) -> Dict[str, Any]:
+        logger.error("Action routing failed for %s: %s", intent, error)
+        return {
+            "status": "error",
+            "message": f"Action failed: {str(error)}",
+            "data": {"error": str(error), "intent": intent}
+        }
     
     def list_actions(self) -> list:
         return list(self.action_map.keys())
@@ -1,2 +1,39 @@
 # Action modules
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
+# Recent stat results (including misses) for paths the actions probe
+_STAT_TTL = 2.0
+_STAT_CACHE_SIZE = 256
+_stat_cache: "OrderedDict[str, Tuple[Optional[os.stat_result], float]]" = OrderedDict()
+_stat_lock = threading.Lock()
+
+def first_entity(entities: Dict[str, Any], *keys: str, default: Any = '') -> Any:
+    for key in keys:
+        value = entities.get(key)
+        if value:
+            return value
+    return default
+
+def cached_stat(path: str) -> Optional[os.stat_result]:
+    now = time.monotonic()
+    with _stat_lock:
+        cached = _stat_cache.get(path)
+        if cached and now - cached[1] < _STAT_TTL:
+            _stat_cache.move_to_end(path)
+            return cached[0]
+    
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    
+    with _stat_lock:
+        _stat_cache[path] = (st, now)
+        _stat_cache.move_to_end(path)
+        if len(_stat_cache) > _STAT_CACHE_SIZE:
+            _stat_cache.popitem(last=False)
+    return st
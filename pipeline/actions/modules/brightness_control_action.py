@@ -1,6 +1,9 @@
 import logging
+import threading
 from typing import Dict, Any
 
+from pipeline.actions.registry import register_action
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -10,6 +13,59 @@ except ImportError:
     HAS_SBC = False
     logger.warning("screen_brightness_control not available. Brightness control disabled.")
 
+_STEP = 10
+_COALESCE_WINDOW = 0.15
+# Steps inside the window are folded into one absolute target level that the
+# timer applies; a failed apply is kept in "error" and raised by the next call.
+_pending = {"target": None, "timer": None, "error": None}
+_pending_lock = threading.Lock()
+
+def _flush_pending():
+    with _pending_lock:
+        target = _pending["target"]
+        _pending["target"] = None
+        _pending["timer"] = None
+    
+    if target is None:
+        return
+    
+    try:
+        sbc.set_brightness(target)
+        logger.info("Brightness adjusted to %s%%", target)
+    except Exception as e:
+        logger.error("Brightness control failed: %s", e)
+        with _pending_lock:
+            _pending["error"] = e
+
+def _queue_step(step: int) -> int:
+    with _pending_lock:
+        error = _pending["error"]
+        if error is not None:
+            _pending["error"] = None
+            raise error
+        
+        if _pending["timer"] is None:
+            current_brightness = sbc.get_brightness()[0]
+            timer = threading.Timer(_COALESCE_WINDOW, _flush_pending)
+            _pending["timer"] = timer
+            timer.start()
+        else:
+            current_brightness = _pending["target"]
+        
+        _pending["target"] = max(0, min(100, current_brightness + step))
+        return _pending["target"]
+
+def _cancel_pending():
+    with _pending_lock:
+        if _pending["timer"] is not None:
+            _pending["timer"].cancel()
+        _pending["target"] = None
+        _pending["timer"] = None
+        _pending["error"] = None
+
+@register_action("BRIGHTNESS_UP", "up")
+@register_action("BRIGHTNESS_DOWN", "down")
+@register_action("BRIGHTNESS_SET", "set")
 def change_brightness(action: str, entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     if not HAS_SBC:
         return {
@@ -19,23 +75,27 @@ def change_brightness(action: str, entities: Dict[str, Any], context: Dict[str,
         }
     
     try:
-        current_brightness = sbc.get_brightness()[0]
-        
         if action == "up":
-            new_brightness = min(100, current_brightness + 10)
-            sbc.set_brightness(new_brightness)
+            new_brightness = _queue_step(_STEP)
             message = f"Brightness increased to {new_brightness}%"
         
         elif action == "down":
-            new_brightness = max(0, current_brightness - 10)
-            sbc.set_brightness(new_brightness)
+            new_brightness = _queue_step(-_STEP)
             message = f"Brightness decreased to {new_brightness}%"
         
         elif action == "set":
+            _cancel_pending()
             level = entities.get('level', 50)
             new_brightness = max(0, min(100, level))
             sbc.set_brightness(new_brightness)
             message = f"Brightness set to {new_brightness}%"
+            
+            logger.info(message)
+            return {
+                "status": "success",
+                "message": message,
+                "data": {"brightness": new_brightness}
+            }
         
         else:
             return {
@@ -52,7 +112,7 @@ def change_brightness(action: str, entities: Dict[str, Any], context: Dict[str,
         }
     
     except Exception as e:
-        logger.error(f"Brightness control failed: {e}")
+        logger.error("Brightness control failed: %s", e)
         return {
             "status": "error",
             "message": f"Failed to change brightness: {str(e)}",
@@ -67,4 +127,3 @@ if __name__ == "__main__":
         print(f"Result: {result}")
     else:
         print("screen_brightness_control not available")
-
@@ -1,9 +1,13 @@
 import os
-import subprocess
+import ctypes
 import logging
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from pathlib import Path
 
+from pipeline.actions.registry import register_action
+from pipeline.actions.modules import first_entity
+
 logger = logging.getLogger(__name__)
 
 APP_PATHS = {
@@ -19,11 +23,32 @@ APP_PATHS = {
     "powershell": "powershell.exe",
 }
 
+_APP_ALIASES = {
+    "google chrome": "chrome",
+    "command prompt": "cmd",
+    "file explorer": "explorer",
+    "ms paint": "paint",
+}
+
+def _build_lookup() -> Mapping[str, str]:
+    lookup = {name.lower(): path for name, path in APP_PATHS.items()}
+    for alias, target in _APP_ALIASES.items():
+        if target in lookup:
+            lookup.setdefault(alias, lookup[target])
+    return MappingProxyType(lookup)
+
+_APP_LOOKUP = _build_lookup()
+
+def _launch(app_path: str):
+    try:
+        os.startfile(app_path)
+    except OSError:
+        if ctypes.windll.shell32.ShellExecuteW(None, "open", app_path, None, None, 1) <= 32:
+            raise FileNotFoundError(app_path)
+
+@register_action("OPEN_APP")
 def open_app(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
-    app_name = entities.get('app', '').lower()
-    
-    if not app_name:
-        app_name = entities.get('APP', '').lower()
+    app_name = first_entity(entities, 'app', 'APP').lower()
     
     if not app_name:
         return {
@@ -32,7 +57,7 @@ def open_app(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any
             "data": {}
         }
     
-    app_path = APP_PATHS.get(app_name)
+    app_path = _APP_LOOKUP.get(app_name)
     
     if not app_path:
         return {
@@ -42,12 +67,9 @@ def open_app(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any
         }
     
     try:
-        if os.path.exists(app_path):
-            os.startfile(app_path)
-        else:
-            subprocess.Popen(app_path, shell=True)
+        _launch(app_path)
         
-        logger.info(f"Opened app: {app_name}")
+        logger.info("Opened app: %s", app_name)
         return {
             "status": "success",
             "message": f"Opening {app_name}",
@@ -55,7 +77,7 @@ def open_app(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any
         }
     
     except FileNotFoundError:
-        logger.error(f"App not found: {app_path}")
+        logger.error("App not found: %s", app_path)
         return {
             "status": "error",
             "message": f"App '{app_name}' not found on system",
@@ -63,7 +85,7 @@ def open_app(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any
         }
     
     except Exception as e:
-        logger.error(f"Failed to open app {app_name}: {e}")
+        logger.error("Failed to open app %s: %s", app_name, e)
         return {
             "status": "error",
             "message": f"Failed to open {app_name}: {str(e)}",
@@ -74,8 +96,10 @@ def list_apps() -> list:
     return list(APP_PATHS.keys())
 
 def add_app(name: str, path: str):
+    global _APP_LOOKUP
     APP_PATHS[name.lower()] = path
-    logger.info(f"Added app: {name} -> {path}")
+    _APP_LOOKUP = _build_lookup()
+    logger.info("Added app: %s -> %s", name, path)
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -1,18 +1,17 @@
 import os
+import stat
 import logging
 from typing import Dict, Any
-from pathlib import Path
+
+from pipeline.actions.registry import register_action
+from pipeline.actions.modules import cached_stat, first_entity
 
 logger = logging.getLogger(__name__)
 
+@register_action("OPEN_FILE")
+@register_action("OPEN_FOLDER")
 def open_file(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
-    file_path = entities.get('file', '')
-    folder_path = entities.get('folder', '')
-    
-    path = file_path or folder_path
-    
-    if not path:
-        path = entities.get('LOCATION', '')
+    path = first_entity(entities, 'file', 'folder', 'LOCATION')
     
     if not path:
         return {
@@ -21,33 +20,34 @@ def open_file(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, An
             "data": {}
         }
     
-    path = Path(path)
+    path = os.path.normpath(str(path))
+    st = cached_stat(path)
     
-    if not path.exists():
+    if st is None:
         return {
             "status": "error",
             "message": f"Path not found: {path}",
-            "data": {"path": str(path)}
+            "data": {"path": path}
         }
     
     try:
-        os.startfile(str(path))
-        logger.info(f"Opened: {path}")
+        os.startfile(path)
+        logger.info("Opened: %s", path)
         
-        item_type = "folder" if path.is_dir() else "file"
+        item_type = "folder" if stat.S_ISDIR(st.st_mode) else "file"
         
         return {
             "status": "success",
-            "message": f"Opening {item_type}: {path.name}",
-            "data": {"path": str(path), "type": item_type}
+            "message": f"Opening {item_type}: {os.path.basename(path)}",
+            "data": {"path": path, "type": item_type}
         }
     
     except Exception as e:
-        logger.error(f"Failed to open {path}: {e}")
+        logger.error("Failed to open %s: %s", path, e)
         return {
             "status": "error",
             "message": f"Failed to open: {str(e)}",
-            "data": {"path": str(path), "error": str(e)}
+            "data": {"path": path, "error": str(e)}
         }
 
 if __name__ == "__main__":
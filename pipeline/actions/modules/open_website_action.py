@@ -1,7 +1,12 @@
+import sys
 import webbrowser
 import logging
+from types import MappingProxyType
 from typing import Dict, Any
 
+from pipeline.actions.registry import register_action
+from pipeline.actions.modules import first_entity
+
 logger = logging.getLogger(__name__)
 
 WEBSITE_SHORTCUTS = {
@@ -20,29 +25,32 @@ WEBSITE_SHORTCUTS = {
     "spotify": "https://open.spotify.com",
 }
 
+_SHORTCUTS = MappingProxyType({name: sys.intern(url) for name, url in WEBSITE_SHORTCUTS.items()})
+_SHORTCUT_KEYS_TUPLE = tuple(_SHORTCUTS.keys())
+_SCHEMES = ("http://", "https://")
+_DEFAULT_SCHEME = sys.intern("https://")
+
+@register_action("OPEN_WEBSITE")
 def open_website(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
-    url = entities.get('url', '')
     website = entities.get('website', '').lower()
-    
-    if not url and not website:
-        url = entities.get('LOCATION', '')
+    url = entities.get('url', '') if website else first_entity(entities, 'url', 'LOCATION')
     
     if website and not url:
-        url = WEBSITE_SHORTCUTS.get(website)
+        url = _SHORTCUTS.get(website)
     
     if not url:
         return {
             "status": "error",
             "message": "No URL or website specified",
-            "data": {"available_shortcuts": list(WEBSITE_SHORTCUTS.keys())}
+            "data": {"available_shortcuts": _SHORTCUT_KEYS_TUPLE}
         }
     
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
+    if not url.startswith(_SCHEMES):
+        url = _DEFAULT_SCHEME + url
     
     try:
         webbrowser.open(url)
-        logger.info(f"Opened website: {url}")
+        logger.info("Opened website: %s", url)
         
         return {
             "status": "success",
@@ -51,7 +59,7 @@ def open_website(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str,
         }
     
     except Exception as e:
-        logger.error(f"Failed to open website {url}: {e}")
+        logger.error("Failed to open website %s: %s", url, e)
         return {
             "status": "error",
             "message": f"Failed to open website: {str(e)}",
@@ -59,7 +67,7 @@ def open_website(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str,
         }
 
 def list_websites() -> list:
-    return list(WEBSITE_SHORTCUTS.keys())
+    return list(_SHORTCUT_KEYS_TUPLE)
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -1,16 +1,17 @@
 import os
 import logging
 from typing import Dict, Any
-from pathlib import Path
+
+from pipeline.actions.registry import register_action
+from pipeline.actions.modules import cached_stat, first_entity
 
 logger = logging.getLogger(__name__)
 
+@register_action("PLAY_MUSIC")
+@register_action("PLAY_MEDIA")
 def play_media(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
-    file_path = entities.get('file', '')
     song_name = entities.get('song', '')
-    
-    if not file_path and not song_name:
-        file_path = entities.get('TASK', '')
+    file_path = entities.get('file', '') if song_name else first_entity(entities, 'file', 'TASK')
     
     if song_name and not file_path:
         return {
@@ -26,31 +27,31 @@ def play_media(entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, A
             "data": {}
         }
     
-    file_path = Path(file_path)
+    file_path = os.path.normpath(str(file_path))
     
-    if not file_path.exists():
+    if cached_stat(file_path) is None:
         return {
             "status": "error",
             "message": f"File not found: {file_path}",
-            "data": {"file": str(file_path)}
+            "data": {"file": file_path}
         }
     
     try:
-        os.startfile(str(file_path))
-        logger.info(f"Playing media: {file_path}")
+        os.startfile(file_path)
+        logger.info("Playing media: %s", file_path)
         
         return {
             "status": "success",
-            "message": f"Playing {file_path.name}",
-            "data": {"file": str(file_path)}
+            "message": f"Playing {os.path.basename(file_path)}",
+            "data": {"file": file_path}
         }
     
     except Exception as e:
-        logger.error(f"Failed to play media {file_path}: {e}")
+        logger.error("Failed to play media %s: %s", file_path, e)
         return {
             "status": "error",
             "message": f"Failed to play media: {str(e)}",
-            "data": {"file": str(file_path), "error": str(e)}
+            "data": {"file": file_path, "error": str(e)}
         }
 
 if __name__ == "__main__":
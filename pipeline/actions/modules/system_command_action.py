@@ -3,10 +3,26 @@ import subprocess
 import logging
 from typing import Dict, Any
 
+from pipeline.actions.registry import register_action
+
 logger = logging.getLogger(__name__)
 
 DANGEROUS_COMMANDS = ["shutdown", "restart"]
 
+_CMD_ARGV = {
+    "shutdown": (["shutdown", "/s", "/t", "60"], "System will shutdown in 60 seconds"),
+    "restart": (["shutdown", "/r", "/t", "60"], "System will restart in 60 seconds"),
+    "lock": (["rundll32.exe", "user32.dll,LockWorkStation"], "Locking system"),
+    "sleep": (["rundll32.exe", "powrprof.dll,SetSuspendState", "0,1,0"], "Putting system to sleep"),
+    "cancel_shutdown": (["shutdown", "/a"], "Shutdown cancelled"),
+}
+
+_CREATION_FLAGS = getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+@register_action("SYSTEM_SHUTDOWN", "shutdown")
+@register_action("SYSTEM_RESTART", "restart")
+@register_action("SYSTEM_LOCK", "lock")
+@register_action("SYSTEM_SLEEP", "sleep")
 def execute_system_command(command: str, entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     safe_mode = context.get('safe_mode', True)
     confirm = entities.get('confirm', False)
@@ -18,35 +34,20 @@ def execute_system_command(command: str, entities: Dict[str, Any], context: Dict
             "data": {"command": command, "requires_confirmation": True}
         }
     
+    entry = _CMD_ARGV.get(command)
+    if entry is None:
+        return {
+            "status": "error",
+            "message": f"Unknown system command: {command}",
+            "data": {"command": command}
+        }
+    
+    argv, message = entry
+    
     try:
-        if command == "shutdown":
-            subprocess.Popen("shutdown /s /t 60", shell=True)
-            message = "System will shutdown in 60 seconds"
-        
-        elif command == "restart":
-            subprocess.Popen("shutdown /r /t 60", shell=True)
-            message = "System will restart in 60 seconds"
-        
-        elif command == "lock":
-            subprocess.Popen("rundll32.exe user32.dll,LockWorkStation", shell=True)
-            message = "Locking system"
-        
-        elif command == "sleep":
-            subprocess.Popen("rundll32.exe powrprof.dll,SetSuspendState 0,1,0", shell=True)
-            message = "Putting system to sleep"
-        
-        elif command == "cancel_shutdown":
-            subprocess.Popen("shutdown /a", shell=True)
-            message = "Shutdown cancelled"
-        
-        else:
-            return {
-                "status": "error",
-                "message": f"Unknown system command: {command}",
-                "data": {"command": command}
-            }
+        subprocess.Popen(argv, shell=False, creationflags=_CREATION_FLAGS, close_fds=True)
         
-        logger.info(f"Executed system command: {command}")
+        logger.info("Executed system command: %s", command)
         return {
             "status": "success",
             "message": message,
@@ -54,7 +55,7 @@ def execute_system_command(command: str, entities: Dict[str, Any], context: Dict
         }
     
     except Exception as e:
-        logger.error(f"System command failed: {e}")
+        logger.error("System command failed: %s", e)
         return {
             "status": "error",
             "message": f"Failed to execute command: {str(e)}",
@@ -1,17 +1,123 @@
 import logging
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from typing import Dict, Any
 
+from pipeline.actions.registry import register_action
+
 logger = logging.getLogger(__name__)
 
 try:
     from ctypes import cast, POINTER
-    from comtypes import CLSCTX_ALL
+    import comtypes
+    from comtypes import CLSCTX_ALL, COMError
     from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
     HAS_PYCAW = True
 except ImportError:
     HAS_PYCAW = False
     logger.warning("pycaw not available. Volume control disabled.")
 
+_STEP = 0.1
+_COALESCE_WINDOW = 0.15
+# Steps inside the window are folded into one absolute target level that the
+# timer applies; a failed apply is kept in "error" and raised by the next call.
+_pending = {"target": None, "timer": None, "error": None}
+_pending_lock = threading.Lock()
+
+# How long a caller waits on the COM worker before giving up
+_WORKER_TIMEOUT = 2.0
+_jobs = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+def _volume_worker():
+    # COM objects are apartment-bound: this thread initialises COM once and
+    # is the only one that ever touches the endpoint volume interface.
+    comtypes.CoInitialize()
+    volume = None
+    while True:
+        job, args, future = _jobs.get()
+        try:
+            if volume is None:
+                volume = get_volume_interface()
+            future.set_result(job(volume, *args) if volume else None)
+        except Exception as e:
+            if isinstance(e, COMError):
+                volume = None
+            future.set_exception(e)
+
+def _submit(job, *args) -> Future:
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_volume_worker, name="volume-com", daemon=True)
+            _worker.start()
+    future = Future()
+    _jobs.put((job, args, future))
+    return future
+
+def _get_level(volume) -> float:
+    return volume.GetMasterVolumeLevelScalar()
+
+def _set_level(volume, new_volume: float) -> float:
+    volume.SetMasterVolumeLevelScalar(new_volume, None)
+    return new_volume
+
+def _finish_flush(future: Future):
+    try:
+        new_volume = future.result()
+        if new_volume is None:
+            raise RuntimeError("Failed to access volume control")
+    except Exception as e:
+        logger.error("Volume control failed: %s", e)
+        with _pending_lock:
+            _pending["error"] = e
+        return
+    logger.info("Volume adjusted to %s%%", int(round(new_volume * 100)))
+
+def _flush_pending():
+    with _pending_lock:
+        target = _pending["target"]
+        _pending["target"] = None
+        _pending["timer"] = None
+    
+    if target is not None:
+        _submit(_set_level, target).add_done_callback(_finish_flush)
+
+def _queue_step(step: float):
+    with _pending_lock:
+        error = _pending["error"]
+        if error is not None:
+            _pending["error"] = None
+            raise error
+        current_volume = _pending["target"]
+    
+    # Read outside the lock: the worker takes it when a flush fails
+    if current_volume is None:
+        current_volume = _submit(_get_level).result(timeout=_WORKER_TIMEOUT)
+        if current_volume is None:
+            return None
+    
+    with _pending_lock:
+        if _pending["timer"] is None:
+            timer = threading.Timer(_COALESCE_WINDOW, _flush_pending)
+            _pending["timer"] = timer
+            timer.start()
+        elif _pending["target"] is not None:
+            current_volume = _pending["target"]
+        
+        _pending["target"] = max(0.0, min(1.0, current_volume + step))
+        return _pending["target"]
+
+def _cancel_pending():
+    with _pending_lock:
+        if _pending["timer"] is not None:
+            _pending["timer"].cancel()
+        _pending["target"] = None
+        _pending["timer"] = None
+        _pending["error"] = None
+
 def get_volume_interface():
     if not HAS_PYCAW:
         return None
@@ -22,9 +128,12 @@ def get_volume_interface():
         volume = cast(interface, POINTER(IAudioEndpointVolume))
         return volume
     except Exception as e:
-        logger.error(f"Failed to get volume interface: {e}")
+        logger.error("Failed to get volume interface: %s", e)
         return None
 
+@register_action("VOLUME_UP", "up")
+@register_action("VOLUME_DOWN", "down")
+@register_action("VOLUME_SET", "set")
 def change_volume(action: str, entities: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     if not HAS_PYCAW:
         return {
@@ -33,32 +142,46 @@ def change_volume(action: str, entities: Dict[str, Any], context: Dict[str, Any]
             "data": {}
         }
     
-    volume = get_volume_interface()
-    if not volume:
-        return {
-            "status": "error",
-            "message": "Failed to access volume control",
-            "data": {}
-        }
-    
     try:
-        current_volume = volume.GetMasterVolumeLevelScalar()
-        
         if action == "up":
-            new_volume = min(1.0, current_volume + 0.1)
-            volume.SetMasterVolumeLevelScalar(new_volume, None)
-            message = f"Volume increased to {int(new_volume * 100)}%"
+            new_volume = _queue_step(_STEP)
+            if new_volume is None:
+                return {
+                    "status": "error",
+                    "message": "Failed to access volume control",
+                    "data": {}
+                }
+            message = f"Volume increased to {int(round(new_volume * 100))}%"
         
         elif action == "down":
-            new_volume = max(0.0, current_volume - 0.1)
-            volume.SetMasterVolumeLevelScalar(new_volume, None)
-            message = f"Volume decreased to {int(new_volume * 100)}%"
+            new_volume = _queue_step(-_STEP)
+            if new_volume is None:
+                return {
+                    "status": "error",
+                    "message": "Failed to access volume control",
+                    "data": {}
+                }
+            message = f"Volume decreased to {int(round(new_volume * 100))}%"
         
         elif action == "set":
+            _cancel_pending()
             level = entities.get('level', 50)
-            new_volume = max(0.0, min(1.0, level / 100.0))
-            volume.SetMasterVolumeLevelScalar(new_volume, None)
-            message = f"Volume set to {int(new_volume * 100)}%"
+            new_volume = _submit(_set_level, max(0.0, min(1.0, level / 100.0))).result(timeout=_WORKER_TIMEOUT)
+            if new_volume is None:
+                return {
+                    "status": "error",
+                    "message": "Failed to access volume control",
+                    "data": {}
+                }
+            
+            message = f"Volume set to {int(round(new_volume * 100))}%"
+            
+            logger.info(message)
+            return {
+                "status": "success",
+                "message": message,
+                "data": {"volume": int(round(new_volume * 100))}
+            }
         
         else:
             return {
@@ -71,11 +194,19 @@ def change_volume(action: str, entities: Dict[str, Any], context: Dict[str, Any]
         return {
             "status": "success",
             "message": message,
-            "data": {"volume": int(new_volume * 100)}
+            "data": {"volume": int(round(new_volume * 100))}
+        }
+    
+    except FutureTimeoutError:
+        logger.error("Volume control timed out after %ss", _WORKER_TIMEOUT)
+        return {
+            "status": "error",
+            "message": "Volume control did not respond",
+            "data": {}
         }
     
     except Exception as e:
-        logger.error(f"Volume control failed: {e}")
+        logger.error("Volume control failed: %s", e)
         return {
             "status": "error",
             "message": f"Failed to change volume: {str(e)}",
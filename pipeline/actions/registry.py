@@ -0,0 +1,17 @@
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
+
+_REGISTRY: Dict[str, Callable] = {}
+
+def register_action(intent: str, *bound_args: Any) -> Callable:
+    def decorator(func: Callable) -> Callable:
+        _REGISTRY[intent] = partial(func, *bound_args) if bound_args else func
+        return func
+    return decorator
+
+def get_registered(intent: str) -> Optional[Callable]:
+    return _REGISTRY.get(intent)
+
+def registered_actions() -> Mapping[str, Callable]:
+    return MappingProxyType(_REGISTRY)
@@ -6,12 +6,14 @@ Real-time phone control via ADB and Accessibility Service
 from .adb_connection import ADBConnection
 from .adb_actions import ADBActions
 from .adb_audio_forward import ADBAudio
+from .adb_pool import ADBConnectionPool
 from .server import AndroidBridgeServer
 
 __all__ = [
     'ADBConnection',
     'ADBActions', 
     'ADBAudio',
+    'ADBConnectionPool',
     'AndroidBridgeServer'
 ]
 
@@ -2,16 +2,39 @@
 ADB Actions - Direct phone control via ADB commands
 """
 
+import os
+import re
+import functools
+import selectors
 import subprocess
 import logging
+import tempfile
+import threading
 import time
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_SHELL_SENTINEL = '__VAANI_END__'
+_SHELL_TIMEOUT = 10
+_SHELL_READ_SIZE = 65536
+
+_TEXT_RE = re.compile(r'text="([^"]+)"')
+_SCREEN_TEXT_CMD = "uiautomator dump /dev/tty 2>/dev/null | grep -oE 'text=\"[^\"]+\"'"
+_FOCUS_RE = re.compile(r'([\w.]+)/[\w.$]+')
+_INPUT_ESCAPE = str.maketrans({' ': '%s', '&': '\\&', '(': '\\(', ')': '\\)'})
+_SMS_ESCAPE = str.maketrans({' ': '%s'})
+
+# Longer or non-ASCII text is pasted from the clipboard instead of `input text`
+_TYPE_TEXT_DIRECT_MAX = 40
+_CLIPBOARD_FILE = '/sdcard/vaani_txt'
+_CLIPPER_PACKAGE = 'ca.zgrs.clipper'
+_CMD_CLIPBOARD_MIN_SDK = 29
+
 
 # Android app package names
-APP_PACKAGES = {
+APP_PACKAGES = MappingProxyType({
     'whatsapp': 'com.whatsapp',
     'chrome': 'com.android.chrome',
     'gmail': 'com.google.android.gm',
@@ -32,37 +55,168 @@ APP_PACKAGES = {
     'calendar': 'com.google.android.calendar',
     'clock': 'com.google.android.deskclock',
     'notes': 'com.google.android.keep',
-}
+})
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_package(app_name: str) -> str:
+    """Map an app name to its package (dotted names are already package ids)"""
+    if '.' in app_name:
+        return app_name
+    return APP_PACKAGES.get(app_name.lower(), app_name)
 
 
 class ADBActions:
     """Execute actions on Android device via ADB"""
 
-    def __init__(self, device_id: str, adb_path: str = 'adb'):
+    def __init__(self, device_id: str, adb_path: str = 'adb', use_persistent: bool = True):
         """
         Initialize ADB actions.
 
         Args:
             device_id: Android device ID from ADB
             adb_path: Path to ADB executable
+            use_persistent: Reuse one long-lived `adb shell` for all commands
         """
         self.device_id = device_id
         self.adb_path = adb_path
+        self._adb_prefix = (adb_path, '-s', device_id)
+        self.use_persistent = use_persistent
+        self.last_exit_code: Optional[int] = None
+        self._screen_size: Optional[Tuple[int, int]] = None
+        self._clipboard_method: Optional[str] = None
+        self._shell_proc: Optional[subprocess.Popen] = None
+        self._shell_sel: Optional[selectors.BaseSelector] = None
+        self._shell_lock = threading.Lock()
+
+    def _spawn_shell(self) -> subprocess.Popen:
+        """Start the long-lived `adb shell` process"""
+        self._shell_proc = subprocess.Popen(
+            [*self._adb_prefix, 'shell'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+        # select() only works on sockets on Windows; there the watchdog timer is used
+        if os.name != 'nt':
+            self._shell_sel = selectors.DefaultSelector()
+            self._shell_sel.register(self._shell_proc.stdout, selectors.EVENT_READ)
+        return self._shell_proc
+
+    def _persistent_shell(self, command: str) -> str:
+        """Run a command in the persistent shell and read output up to the sentinel"""
+        with self._shell_lock:
+            proc = self._shell_proc
+            if proc is None or proc.poll() is not None:
+                proc = self._spawn_shell()
+
+            proc.stdin.write(f'{command}; echo {_SHELL_SENTINEL}$?\n'.encode())
+            proc.stdin.flush()
+
+            # A hung command kills the shell; it is respawned on the next call
+            watchdog = None
+            if self._shell_sel is None:
+                watchdog = threading.Timer(_SHELL_TIMEOUT, proc.kill)
+                watchdog.start()
+            try:
+                output, code = self._read_until_sentinel(proc, time.monotonic() + _SHELL_TIMEOUT)
+            finally:
+                if watchdog:
+                    watchdog.cancel()
+
+            self.last_exit_code = int(code) if code.isdigit() else None
+            return output.strip()
+
+    def _read_until_sentinel(self, proc: subprocess.Popen, deadline: float) -> Tuple[str, str]:
+        """Read shell output up to the sentinel line, returning (output, exit code)"""
+        sentinel = _SHELL_SENTINEL.encode()
+        fd = proc.stdout.fileno()
+        buf = bytearray()
+        while True:
+            marker = buf.find(sentinel)
+            if marker != -1:
+                end = buf.find(b'\n', marker)
+                if end != -1:
+                    code = buf[marker + len(sentinel):end].decode(errors='replace').strip()
+                    return buf[:marker].decode(errors='replace'), code
+
+            if self._shell_sel is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._shell_sel.select(remaining):
+                    raise TimeoutError(f"adb shell command timed out after {_SHELL_TIMEOUT}s")
+
+            chunk = os.read(fd, _SHELL_READ_SIZE)
+            if not chunk:
+                raise BrokenPipeError("adb shell closed")
+            buf += chunk
+
+    def close(self):
+        """Terminate the persistent shell"""
+        with self._shell_lock:
+            if self._shell_proc is not None:
+                try:
+                    self._shell_proc.kill()
+                    self._shell_proc.wait(timeout=2)
+                except Exception:
+                    pass
+                self._shell_proc = None
+            if self._shell_sel is not None:
+                self._shell_sel.close()
+                self._shell_sel = None
 
     def _shell(self, command: str) -> str:
         """Execute ADB shell command"""
+        if self.use_persistent:
+            try:
+                return self._persistent_shell(command)
+            except Exception as e:
+                logger.error(f"Shell command failed: {command} - {e}")
+                self.close()
+                return ""
+
         try:
             result = subprocess.run(
-                [self.adb_path, '-s', self.device_id, 'shell', command],
+                [*self._adb_prefix, 'shell', command],
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=_SHELL_TIMEOUT
             )
+            self.last_exit_code = result.returncode
             return result.stdout.strip()
         except Exception as e:
             logger.error(f"Shell command failed: {command} - {e}")
             return ""
     
+    def _exec_out(self, command: str) -> bytes:
+        """Execute command over the raw `adb exec-out` channel"""
+        try:
+            result = subprocess.run(
+                [*self._adb_prefix, 'exec-out', command],
+                capture_output=True,
+                timeout=_SHELL_TIMEOUT
+            )
+            return result.stdout
+        except Exception as e:
+            logger.error(f"exec-out command failed: {command} - {e}")
+            return b""
+
+    def batch(self, cmds: List[str], background: bool = False) -> str:
+        """
+        Execute several shell commands in a single round trip.
+        
+        Args:
+            cmds: Shell commands, run in order (may include `sleep N` steps)
+            background: Detach the script on the device and return immediately
+            
+        Returns:
+            Combined output of all commands ("" when run in the background)
+        """
+        script = ' ; '.join(cmds)
+        if background:
+            return self._shell(f'( {script} ) >/dev/null 2>&1 & :')
+        return self._shell(script)
+
     def open_app(self, app_name: str) -> Dict[str, Any]:
         """
         Open app by name or package.
@@ -73,8 +227,7 @@ class ADBActions:
         Returns:
             Result dictionary
         """
-        # Get package name
-        package = APP_PACKAGES.get(app_name.lower(), app_name)
+        package = _resolve_package(app_name)
         
         logger.info(f"📱 Opening app: {app_name} ({package})")
         
@@ -87,8 +240,9 @@ class ADBActions:
                 return {"status": "success", "message": f"Opened {app_name}"}
             
             # Method 2: Activity manager
-            self._shell(f'am start -n {package}')
-            time.sleep(0.5)
+            if not self._start_activity(f'-n {package}'):
+                logger.error(f"❌ Could not launch {app_name}")
+                return {"status": "error", "message": f"Could not launch {app_name}"}
             
             return {"status": "success", "message": f"Opened {app_name}"}
             
@@ -150,11 +304,12 @@ class ADBActions:
         logger.info(f"⌨️ Typing: {text}")
         
         try:
+            if (len(text) > _TYPE_TEXT_DIRECT_MAX or not text.isascii()) and self._set_clipboard(text):
+                self._shell('input keyevent 279')  # KEYCODE_PASTE
+                return {"status": "success", "message": f"Typed: {text}"}
+            
             # Escape special characters
-            text = text.replace(' ', '%s')
-            text = text.replace('&', '\\&')
-            text = text.replace('(', '\\(')
-            text = text.replace(')', '\\)')
+            text = text.translate(_INPUT_ESCAPE)
             
             self._shell(f'input text "{text}"')
             return {"status": "success", "message": f"Typed: {text}"}
@@ -162,6 +317,70 @@ class ADBActions:
             logger.error(f"❌ Type failed: {e}")
             return {"status": "error", "message": str(e)}
     
+    def _detect_clipboard_method(self) -> str:
+        """
+        Find out once per session how text can reach the device clipboard.
+        
+        Returns:
+            'clipper' if the Clipper app is installed, 'cmd' for `cmd clipboard`
+            on API 29+, or '' if neither is available
+        """
+        if self._clipboard_method is None:
+            output = self._shell(f'getprop ro.build.version.sdk; pm list packages {_CLIPPER_PACKAGE}')
+            lines = output.split()
+            if f'package:{_CLIPPER_PACKAGE}' in lines:
+                self._clipboard_method = 'clipper'
+            elif lines and lines[0].isdigit() and int(lines[0]) >= _CMD_CLIPBOARD_MIN_SDK:
+                self._clipboard_method = 'cmd'
+            else:
+                self._clipboard_method = ''
+                logger.info("ℹ️ No clipboard helper on device, long text is typed with input text")
+        return self._clipboard_method
+
+    def _set_clipboard(self, text: str) -> bool:
+        """
+        Put text on the device clipboard via the Clipper app or `cmd clipboard`.
+        
+        Args:
+            text: Text to copy
+            
+        Returns:
+            True if the clipboard accepted the text
+        """
+        method = self._detect_clipboard_method()
+        if not method:
+            return False
+        
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as f:
+            f.write(text)
+            local_path = f.name
+        
+        try:
+            result = subprocess.run(
+                [*self._adb_prefix, 'push', local_path, _CLIPBOARD_FILE],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=_SHELL_TIMEOUT
+            )
+            if result.returncode != 0:
+                logger.warning(f"⚠️ Could not push text for the clipboard (adb exit {result.returncode})")
+                return False
+        finally:
+            os.remove(local_path)
+        
+        if method == 'clipper':
+            output = self._shell(f'am broadcast -a clipper.set -e text "$(cat {_CLIPBOARD_FILE})"')
+            accepted = 'result=-1' in output
+        else:
+            output = self._shell(f'cmd clipboard set-text "$(cat {_CLIPBOARD_FILE})"')
+            accepted = self.last_exit_code == 0 and 'Exception' not in output and 'Unknown' not in output
+        
+        if not accepted:
+            # Don't pay for a push on every long string once the helper has failed
+            logger.warning(f"⚠️ Clipboard via {method} failed, falling back to input text: {output}")
+            self._clipboard_method = ''
+        return accepted
+    
     def press_back(self) -> Dict[str, Any]:
         """Press back button"""
         logger.info("⬅️ Pressing back")
@@ -191,29 +410,20 @@ class ADBActions:
     def scroll_down(self) -> Dict[str, Any]:
         """Scroll down"""
         logger.info("📜 Scrolling down")
-        # Get screen size
-        size = self._shell('wm size')
-        if 'x' in size:
-            try:
-                width, height = map(int, size.split(':')[-1].strip().split('x'))
-                cx, cy = width // 2, height // 2
-                return self.swipe(cx, cy + 300, cx, cy - 300, 300)
-            except:
-                pass
+        size = self._cached_screen_size()
+        if size:
+            cx, cy = size[0] // 2, size[1] // 2
+            return self.swipe(cx, cy + 300, cx, cy - 300, 300)
         # Fallback
         return self.swipe(540, 1500, 540, 500, 300)
 
     def scroll_up(self) -> Dict[str, Any]:
         """Scroll up"""
         logger.info("📜 Scrolling up")
-        size = self._shell('wm size')
-        if 'x' in size:
-            try:
-                width, height = map(int, size.split(':')[-1].strip().split('x'))
-                cx, cy = width // 2, height // 2
-                return self.swipe(cx, cy - 300, cx, cy + 300, 300)
-            except:
-                pass
+        size = self._cached_screen_size()
+        if size:
+            cx, cy = size[0] // 2, size[1] // 2
+            return self.swipe(cx, cy - 300, cx, cy + 300, 300)
         return self.swipe(540, 500, 540, 1500, 300)
 
     def call_number(self, phone_number: str) -> Dict[str, Any]:
@@ -231,29 +441,56 @@ class ADBActions:
         logger.info(f"💬 Sending SMS to {phone_number}")
         try:
             # Open messaging app with number and message
-            message_escaped = message.replace(' ', '%s')
-            self._shell(f'am start -a android.intent.action.SENDTO -d sms:{phone_number} --es sms_body "{message_escaped}"')
-            time.sleep(1)
+            message_escaped = message.translate(_SMS_ESCAPE)
+            if not self._start_activity(f'-a android.intent.action.SENDTO -d sms:{phone_number} --es sms_body "{message_escaped}"'):
+                logger.error("❌ SMS failed: messaging app did not open")
+                return {"status": "error", "message": "Messaging app did not open"}
             # Press send button (usually at bottom right)
-            size = self._shell('wm size')
-            if 'x' in size:
-                width, height = map(int, size.split(':')[-1].strip().split('x'))
-                self.tap(width - 100, height - 100)
+            size = self._cached_screen_size()
+            if size:
+                self._shell(f'input tap {size[0] - 100} {size[1] - 100}')
             return {"status": "success", "message": "SMS sent"}
         except Exception as e:
             logger.error(f"❌ SMS failed: {e}")
             return {"status": "error", "message": str(e)}
 
+    def _start_activity(self, args: str) -> bool:
+        """
+        Start an activity and wait for the launch instead of sleeping blindly.
+        
+        `am start -W` returns once the activity is displayed, or straight
+        away with an error if the intent cannot be resolved.
+        
+        Args:
+            args: Arguments for `am start`
+            
+        Returns:
+            True if the activity manager reported a successful launch
+        """
+        output = self._shell(f'am start -W {args}')
+        return 'Status: ok' in output and not any(
+            line.startswith('Error') for line in output.splitlines()
+        )
+
+    def _cached_screen_size(self) -> Optional[Tuple[int, int]]:
+        """Screen dimensions from `wm size`, queried once per session"""
+        if self._screen_size is None:
+            try:
+                size = self._shell('wm size')
+                if 'x' in size:
+                    width, height = map(int, size.split(':')[-1].strip().split('x'))
+                    self._screen_size = (width, height)
+            except:
+                pass
+        return self._screen_size
+
+    def invalidate_screen_size(self):
+        """Forget the cached screen size (e.g. after a rotation)"""
+        self._screen_size = None
+
     def get_screen_size(self) -> tuple:
         """Get screen dimensions"""
-        try:
-            size = self._shell('wm size')
-            if 'x' in size:
-                width, height = map(int, size.split(':')[-1].strip().split('x'))
-                return (width, height)
-        except:
-            pass
-        return (1080, 2400)  # Default
+        return self._cached_screen_size() or (1080, 2400)  # Default
 
     def take_screenshot(self, save_path: str = '/sdcard/screenshot.png') -> Dict[str, Any]:
         """Take screenshot"""
@@ -267,14 +504,11 @@ class ADBActions:
     def get_current_app(self) -> str:
         """Get current foreground app package"""
         try:
-            output = self._shell('dumpsys window | grep mCurrentFocus')
-            if output:
-                # Extract package name
-                parts = output.split()
-                for part in parts:
-                    if '/' in part:
-                        package = part.split('/')[0]
-                        return package
+            # grep on-device so only the focus line crosses USB
+            output = self._shell('dumpsys window | grep -o "mCurrentFocus=.*"')
+            m = _FOCUS_RE.search(output)
+            if m:
+                return m.group(1)
         except:
             pass
         return ""
@@ -303,33 +537,44 @@ class ADBActions:
         """Read screen text using UI dump"""
         logger.info("📖 Reading screen text")
         try:
-            # Dump UI hierarchy
-            self._shell('uiautomator dump /sdcard/window_dump.xml')
-            xml = self._shell('cat /sdcard/window_dump.xml')
-
-            # Extract text from XML
-            import re
-            texts = re.findall(r'text="([^"]+)"', xml)
-            texts = [t for t in texts if t.strip() and t != 'null' and len(t) > 0]
-
-            if texts:
-                screen_text = ' '.join(texts[:30])  # First 30 text elements
-                logger.info(f"📄 Screen text: {screen_text[:100]}...")
-                return {
-                    "status": "success",
-                    "message": "Screen read",
-                    "data": {"text": screen_text, "elements": texts}
-                }
-            else:
-                return {
-                    "status": "success",
-                    "message": "No text on screen",
-                    "data": {"text": "", "elements": []}
-                }
+            # Dump UI hierarchy and keep only the text attributes on-device
+            return self._screen_text_result(self._exec_out(_SCREEN_TEXT_CMD))
         except Exception as e:
             logger.error(f"❌ Screen read failed: {e}")
             return {"status": "error", "message": str(e)}
 
+    def read_notifications(self) -> Dict[str, Any]:
+        """Open the notification shade, read it and close it in one adb call"""
+        logger.info("🔔 Reading notifications")
+        try:
+            output = self._exec_out(
+                f'cmd statusbar expand-notifications; sleep 1; {_SCREEN_TEXT_CMD}; cmd statusbar collapse'
+            )
+            return self._screen_text_result(output)
+        except Exception as e:
+            logger.error(f"❌ Notification read failed: {e}")
+            return {"status": "error", "message": str(e)}
+
+    def _screen_text_result(self, output: bytes) -> Dict[str, Any]:
+        """Build the screen-read result from grepped text attributes"""
+        texts = [t for t in _TEXT_RE.findall(output.decode('utf-8', errors='replace'))
+                 if t.strip() and t != 'null']
+
+        if texts:
+            screen_text = ' '.join(texts[:30])  # First 30 text elements
+            logger.info(f"📄 Screen text: {screen_text[:100]}...")
+            return {
+                "status": "success",
+                "message": "Screen read",
+                "data": {"text": screen_text, "elements": texts}
+            }
+        else:
+            return {
+                "status": "success",
+                "message": "No text on screen",
+                "data": {"text": "", "elements": []}
+            }
+
     def open_notification_shade(self) -> Dict[str, Any]:
         """Open notification shade"""
         logger.info("🔔 Opening notifications")
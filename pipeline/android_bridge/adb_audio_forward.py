@@ -3,14 +3,23 @@ ADB Audio Forwarding
 Stream audio between phone and laptop
 """
 
+import os
+import posixpath
 import subprocess
 import logging
 import threading
 import numpy as np
-from typing import Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 
 logger = logging.getLogger(__name__)
 
+_BLOCKSIZE = 2048
+_RING_CHUNKS = 32
+
+# adb push timeout: fixed overhead plus time at a conservative USB rate
+_PUSH_BASE_TIMEOUT = 10
+_PUSH_BYTES_PER_SEC = 1_000_000
+
 
 class ADBAudio:
     """Handle audio streaming between phone and laptop"""
@@ -25,16 +34,28 @@ class ADBAudio:
         """
         self.device_id = device_id
         self.adb_path = adb_path
+        self._adb_prefix = (adb_path, '-s', device_id)
         self.recording = False
         self.record_thread: Optional[threading.Thread] = None
         self.audio_callback: Optional[Callable] = None
+        self.dispatch_thread: Optional[threading.Thread] = None
+
+        # Chunks handed from the PortAudio thread to the dispatch thread
+        self._ring = np.empty((_RING_CHUNKS, _BLOCKSIZE), dtype=np.float32)
+        self._ring_lens = np.zeros(_RING_CHUNKS, dtype=np.int64)
+        self._ring_head = 0
+        self._ring_tail = 0
+        self._ring_lock = threading.Lock()
+        self._ring_event = threading.Event()
+        self._chunk_buf = np.empty(_BLOCKSIZE, dtype=np.float32)
         
     def start_mic_stream(self, callback: Callable[[np.ndarray], None]) -> bool:
         """
         Start streaming phone microphone to laptop.
         
         Args:
-            callback: Function to call with audio chunks
+            callback: Function to call with audio chunks. The array is reused
+                between calls, so copy it if it must outlive the call.
             
         Returns:
             True if started successfully
@@ -43,6 +64,14 @@ class ADBAudio:
         
         self.audio_callback = callback
         self.recording = True
+        self._ring_head = self._ring_tail = 0
+        
+        # Start dispatch thread (runs the user callback off the audio thread)
+        self.dispatch_thread = threading.Thread(
+            target=self._dispatch_loop,
+            daemon=True
+        )
+        self.dispatch_thread.start()
         
         # Start recording thread
         self.record_thread = threading.Thread(
@@ -71,14 +100,13 @@ class ADBAudio:
                     logger.warning(f"Audio status: {status}")
                 
                 if self.recording and self.audio_callback:
-                    audio_chunk = indata[:, 0].copy()
-                    self.audio_callback(audio_chunk)
+                    self._push_chunk(indata[:, 0])
             
             with sd.InputStream(
                 samplerate=16000,
                 channels=1,
                 dtype='float32',
-                blocksize=2048,
+                blocksize=_BLOCKSIZE,
                 callback=audio_callback
             ):
                 while self.recording:
@@ -88,6 +116,41 @@ class ADBAudio:
             logger.error(f"❌ Audio recording failed: {e}")
             self.recording = False
     
+    def _push_chunk(self, samples: np.ndarray):
+        """Copy a chunk into the ring buffer (called on the audio thread)"""
+        n = min(len(samples), _BLOCKSIZE)
+        with self._ring_lock:
+            if self._ring_head - self._ring_tail >= _RING_CHUNKS:
+                # Consumer fell behind - drop the oldest chunk
+                self._ring_tail += 1
+            idx = self._ring_head % _RING_CHUNKS
+            self._ring[idx, :n] = samples[:n]
+            self._ring_lens[idx] = n
+            self._ring_head += 1
+        self._ring_event.set()
+    
+    def _dispatch_loop(self):
+        """Drain the ring buffer and invoke the user callback"""
+        while self.recording or self._ring_tail != self._ring_head:
+            self._ring_event.wait(0.1)
+            self._ring_event.clear()
+            
+            while True:
+                with self._ring_lock:
+                    if self._ring_tail == self._ring_head:
+                        break
+                    idx = self._ring_tail % _RING_CHUNKS
+                    n = self._ring_lens[idx]
+                    chunk = self._chunk_buf[:n]
+                    np.copyto(chunk, self._ring[idx, :n])
+                    self._ring_tail += 1
+                
+                try:
+                    if self.audio_callback:
+                        self.audio_callback(chunk)
+                except Exception as e:
+                    logger.error(f"Audio callback failed: {e}")
+    
     def stop_mic_stream(self):
         """Stop microphone streaming"""
         logger.info("Stopping microphone stream...")
@@ -96,6 +159,10 @@ class ADBAudio:
         if self.record_thread:
             self.record_thread.join(timeout=2)
         
+        if self.dispatch_thread:
+            self._ring_event.set()
+            self.dispatch_thread.join(timeout=2)
+        
         logger.info("✅ Microphone stream stopped")
     
     def play_audio_on_phone(self, audio_file: str) -> bool:
@@ -113,8 +180,10 @@ class ADBAudio:
             
             # Use media player
             subprocess.run(
-                ['adb', '-s', self.device_id, 'shell', 
+                [*self._adb_prefix, 'shell',
                  f'am start -a android.intent.action.VIEW -d file://{audio_file} -t audio/*'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5
             )
             
@@ -142,13 +211,15 @@ class ADBAudio:
             
             # Use Android TTS service
             subprocess.run(
-                ['adb', '-s', self.device_id, 'shell',
+                [*self._adb_prefix, 'shell',
                  f'am start -a android.intent.action.TTS_SERVICE --es android.intent.extra.TEXT "{text_escaped}"'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5
             )
             
             # Alternative: Use termux-tts-speak if Termux is installed
-            # subprocess.run(['adb', '-s', self.device_id, 'shell', f'termux-tts-speak "{text_escaped}"'])
+            # subprocess.run([*self._adb_prefix, 'shell', f'termux-tts-speak "{text_escaped}"'])
             
             return True
             
@@ -167,18 +238,65 @@ class ADBAudio:
         Returns:
             True if successful
         """
-        try:
-            logger.info(f"📤 Pushing audio to phone: {local_path} -> {phone_path}")
-            
-            subprocess.run(
-                ['adb', '-s', self.device_id, 'push', local_path, phone_path],
-                timeout=10
-            )
+        return self.push_audio_files([(local_path, phone_path)])
+    
+    def push_audio_files(self, pairs: List[Tuple[str, str]]) -> bool:
+        """
+        Push several audio files to phone. This is the recommended bulk path.
+        
+        Files whose destination keeps the local file name are grouped by
+        destination directory and sent with a single `adb push`.
+        
+        Args:
+            pairs: (local_path, phone_path) tuples
             
+        Returns:
+            True if every push succeeded
+        """
+        batches: Dict[str, List[str]] = {}
+        commands = []
+        
+        for local_path, phone_path in pairs:
+            phone_dir, name = posixpath.split(phone_path)
+            if name == os.path.basename(local_path):
+                batches.setdefault(phone_dir + '/', []).append(local_path)
+            else:
+                commands.append(([local_path], phone_path))
+        
+        commands.extend((local_paths, phone_dir) for phone_dir, local_paths in batches.items())
+        
+        ok = True
+        for local_paths, destination in commands:
+            try:
+                logger.info(f"📤 Pushing audio to phone: {', '.join(local_paths)} -> {destination}")
+                
+                result = subprocess.run(
+                    [*self._adb_prefix, 'push', *local_paths, destination],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=self._push_timeout(local_paths)
+                )
+                
+                if result.returncode != 0:
+                    logger.error(f"❌ File push failed with exit code {result.returncode}: "
+                                 f"{result.stderr.decode(errors='replace').strip()}")
+                    ok = False
+                    
+            except Exception as e:
+                logger.error(f"❌ File push failed: {e}")
+                ok = False
+        
+        if ok:
             logger.info("✅ Audio file pushed")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ File push failed: {e}")
-            return False
-
+        return ok
+    
+    @staticmethod
+    def _push_timeout(local_paths: List[str]) -> float:
+        """Timeout proportional to the number of bytes being pushed"""
+        total = 0
+        for path in local_paths:
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                pass
+        return _PUSH_BASE_TIMEOUT + total / _PUSH_BYTES_PER_SEC
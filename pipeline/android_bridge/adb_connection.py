@@ -3,6 +3,7 @@ ADB Connection Manager
 Handles device detection, connection, and port forwarding
 """
 
+import os
 import subprocess
 import logging
 import time
@@ -10,6 +11,9 @@ from typing import Optional, List
 
 logger = logging.getLogger(__name__)
 
+# ADB executable resolved by the first successful probe, shared by all connections
+_ADB_PATH_CACHE: Optional[str] = None
+
 
 class ADBConnection:
     """Manage ADB connection to Android device"""
@@ -22,6 +26,11 @@ class ADBConnection:
 
     def check_adb_installed(self) -> bool:
         """Check if ADB is installed and accessible"""
+        global _ADB_PATH_CACHE
+        if _ADB_PATH_CACHE:
+            self.adb_path = _ADB_PATH_CACHE
+            return True
+
         # Common ADB locations
         adb_paths = [
             'adb',
@@ -29,17 +38,21 @@ class ADBConnection:
             r'C:\platform-tools\adb.exe',
             r'C:\Android\platform-tools\adb.exe',
         ]
+        env_path = os.environ.get('ANDROID_ADB_PATH')
+        if env_path:
+            adb_paths.insert(0, env_path)
 
         for adb_path in adb_paths:
             try:
                 result = subprocess.run(
                     [adb_path, 'version'],
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=5
                 )
                 if result.returncode == 0:
                     self.adb_path = adb_path
+                    _ADB_PATH_CACHE = adb_path
                     logger.info(f"✅ ADB found at: {adb_path}")
                     return True
             except (FileNotFoundError, Exception):
@@ -52,9 +65,11 @@ class ADBConnection:
         """Restart ADB server"""
         try:
             logger.info("Restarting ADB server...")
-            subprocess.run([self.adb_path, 'kill-server'], timeout=5)
+            subprocess.run([self.adb_path, 'kill-server'],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
             time.sleep(1)
-            subprocess.run([self.adb_path, 'start-server'], timeout=5)
+            subprocess.run([self.adb_path, 'start-server'],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
             time.sleep(2)
             logger.info("✅ ADB server restarted")
             return True
@@ -140,10 +155,14 @@ class ADBConnection:
     def _print_device_info(self):
         """Print device information"""
         try:
-            # Get device model
-            model = self._shell_command('getprop ro.product.model')
-            manufacturer = self._shell_command('getprop ro.product.manufacturer')
-            android_version = self._shell_command('getprop ro.build.version.release')
+            # Read all three props in a single shell round trip
+            output = self._shell_command(
+                'getprop ro.product.model; echo ---; '
+                'getprop ro.product.manufacturer; echo ---; '
+                'getprop ro.build.version.release'
+            )
+            parts = [part.strip() for part in output.split('---')]
+            model, manufacturer, android_version = (parts + ['', '', ''])[:3]
             
             logger.info(f"📱 Device: {manufacturer} {model}")
             logger.info(f"🤖 Android: {android_version}")
@@ -158,6 +177,8 @@ class ADBConnection:
             subprocess.run(
                 [self.adb_path, '-s', self.device_id, 'forward',
                  f'tcp:{self.server_port}', f'tcp:{self.server_port}'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5
             )
             logger.info(f"✅ Port forwarding: localhost:{self.server_port}")
@@ -184,7 +205,9 @@ class ADBConnection:
             try:
                 # Remove port forwarding
                 subprocess.run(
-                    ['adb', '-s', self.device_id, 'forward', '--remove-all'],
+                    [self.adb_path, '-s', self.device_id, 'forward', '--remove-all'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=5
                 )
             except:
@@ -199,6 +222,15 @@ class ADBConnection:
         if not self.connected or not self.device_id:
             return False
         
-        devices = self.detect_devices()
-        return self.device_id in devices
+        # Ask about this device only rather than enumerating every device
+        try:
+            result = subprocess.run(
+                [self.adb_path, '-s', self.device_id, 'get-state'],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            return result.returncode == 0 and result.stdout.strip() == 'device'
+        except Exception:
+            return False
 
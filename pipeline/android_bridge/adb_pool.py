@@ -0,0 +1,80 @@
+"""
+ADB Connection Pool
+One persistent shell per connected device, with fan-out across devices
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from .adb_connection import ADBConnection
+from .adb_actions import ADBActions
+
+logger = logging.getLogger(__name__)
+
+
+class ADBConnectionPool:
+    """Keep an ADBActions (and its persistent shell) for every connected device"""
+
+    def __init__(self, connection: Optional[ADBConnection] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            connection: Connection used for ADB lookup and device detection
+        """
+        self.connection = connection or ADBConnection()
+        self.devices: Dict[str, ADBActions] = {}
+
+    def connect_all(self) -> int:
+        """
+        Attach to every detected device.
+
+        Devices that have disappeared since the last call are closed and dropped.
+
+        Returns:
+            Number of devices in the pool
+        """
+        if not self.connection.check_adb_installed():
+            return 0
+
+        detected = self.connection.detect_devices()
+
+        for device_id in list(self.devices):
+            if device_id not in detected:
+                logger.info(f"📴 Device removed from pool: {device_id}")
+                self.devices.pop(device_id).close()
+
+        for device_id in detected:
+            if device_id not in self.devices:
+                self.devices[device_id] = ADBActions(device_id, self.connection.adb_path)
+                logger.info(f"📱 Device added to pool: {device_id}")
+
+        return len(self.devices)
+
+    def get(self, device_id: str) -> Optional[ADBActions]:
+        """Get the actions object for a device"""
+        return self.devices.get(device_id)
+
+    def broadcast(self, command: str) -> Dict[str, str]:
+        """
+        Run a shell command on every device in parallel.
+
+        Args:
+            command: Shell command to run
+
+        Returns:
+            Output per device ID
+        """
+        if not self.devices:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(self.devices)) as executor:
+            outputs = executor.map(lambda actions: actions._shell(command), self.devices.values())
+            return dict(zip(self.devices, outputs))
+
+    def close(self):
+        """Close every persistent shell in the pool"""
+        for actions in self.devices.values():
+            actions.close()
+        self.devices.clear()
@@ -0,0 +1,31 @@
+"""
+Fast JSON helpers
+Uses orjson when installed, falling back to the standard library json module
+"""
+
+import json
+import logging
+from typing import Any, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    logger.debug("orjson not available. Using standard library json.")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -4,7 +4,7 @@ Routes VAANI intents to phone actions via ADB
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
 from .adb_connection import ADBConnection
 from .adb_actions import ADBActions
 from .adb_audio_forward import ADBAudio
@@ -21,6 +21,8 @@ class PhoneActionExecutor:
         self.actions: Optional[ADBActions] = None
         self.audio: Optional[ADBAudio] = None
         self.connected = False
+        self._handlers = self._build_handlers()
+        self._swipe_coords: Dict[str, Tuple[int, int, int, int]] = {}
         
     def connect(self, device_id: Optional[str] = None) -> bool:
         """
@@ -34,6 +36,15 @@ class PhoneActionExecutor:
         """
         if self.connection.connect(device_id):
             self.actions = ADBActions(self.connection.device_id, self.connection.adb_path)
+            # Query `wm size` now so the first swipe/photo doesn't pay for it
+            width, height = self.actions.get_screen_size()
+            cx, cy = width // 2, height // 2
+            self._swipe_coords = {
+                'down': (cx, cy + 300, cx, cy - 300),
+                'up': (cx, cy - 300, cx, cy + 300),
+                'left': (cx + 300, cy, cx - 300, cy),
+                'right': (cx - 300, cy, cx + 300, cy),
+            }
             self.audio = ADBAudio(self.connection.device_id, self.connection.adb_path)
             self.connected = True
             logger.info("✅ Phone action executor ready")
@@ -72,9 +83,9 @@ class PhoneActionExecutor:
             logger.warning(f"⚠️ No handler for intent: {intent}")
             return {"status": "error", "message": f"No handler for intent: {intent}"}
     
-    def _get_handler(self, intent: str):
-        """Get handler function for intent"""
-        handlers = {
+    def _build_handlers(self) -> Dict[str, Callable[[Dict, Dict], Dict[str, Any]]]:
+        """Build the intent -> handler dispatch table"""
+        return {
             # App control
             'OPEN_APP': self._open_app,
             'CLOSE_APP': self._close_app,
@@ -108,14 +119,16 @@ class PhoneActionExecutor:
             'BRIGHTNESS_DOWN': self._brightness_down,
             
             # Navigation
-            'GO_BACK': lambda e, c: self.actions.press_back(),
-            'GO_HOME': lambda e, c: self.actions.press_home(),
+            'GO_BACK': self._go_back,
+            'GO_HOME': self._go_home,
             
             # Emergency
             'EMERGENCY_SOS': self._emergency_sos,
         }
-        
-        return handlers.get(intent)
+    
+    def _get_handler(self, intent: str):
+        """Get handler function for intent"""
+        return self._handlers.get(intent)
     
     def _open_app(self, entities: Dict, context: Dict) -> Dict[str, Any]:
         """Open app on phone"""
@@ -176,19 +189,10 @@ class PhoneActionExecutor:
         """Perform swipe gesture"""
         direction = entities.get('direction', 'down').lower()
 
-        width, height = self.actions.get_screen_size()
-        cx, cy = width // 2, height // 2
-
-        if direction == 'down':
-            return self.actions.swipe(cx, cy + 300, cx, cy - 300)
-        elif direction == 'up':
-            return self.actions.swipe(cx, cy - 300, cx, cy + 300)
-        elif direction == 'left':
-            return self.actions.swipe(cx + 300, cy, cx - 300, cy)
-        elif direction == 'right':
-            return self.actions.swipe(cx - 300, cy, cx + 300, cy)
-        else:
+        coords = self._swipe_coords.get(direction)
+        if coords is None:
             return {"status": "error", "message": f"Unknown direction: {direction}"}
+        return self.actions.swipe(*coords)
 
     def _scroll(self, entities: Dict, context: Dict) -> Dict[str, Any]:
         """Scroll page"""
@@ -217,18 +221,8 @@ class PhoneActionExecutor:
         """Read notifications"""
         logger.info("🔔 Reading notifications")
 
-        # Open notification shade
-        self.actions.open_notification_shade()
-
-        # Read screen text
-        import time
-        time.sleep(1)
-        result = self.actions.read_screen_text()
-
-        # Close notification shade
-        self.actions.close_notification_shade()
-
-        return result
+        # Open shade, read screen text and close shade in one adb call
+        return self.actions.read_notifications()
 
     def _play_music(self, entities: Dict, context: Dict) -> Dict[str, Any]:
         """Play music"""
@@ -247,17 +241,16 @@ class PhoneActionExecutor:
         """Take photo"""
         logger.info("📸 Taking photo")
 
-        # Open camera
-        result = self.actions.open_app('camera')
-
-        # Wait and tap shutter button (usually center bottom)
-        import time
-        time.sleep(2)
-
+        # Open camera, wait and tap shutter button (usually center bottom);
+        # the phone does the waiting so the pipeline isn't held for 2s
         width, height = self.actions.get_screen_size()
-        self.actions.tap(width // 2, height - 200)
+        self.actions.batch([
+            'am start -a android.media.action.STILL_IMAGE_CAMERA',
+            'sleep 2',
+            f'input tap {width // 2} {height - 200}'
+        ], background=True)
 
-        return result
+        return {"status": "success", "message": "Opened camera"}
 
     def _set_volume(self, entities: Dict, context: Dict) -> Dict[str, Any]:
         """Set volume level"""
@@ -285,6 +278,14 @@ class PhoneActionExecutor:
         logger.info("🌙 Brightness down")
         return self.actions.set_brightness(50)
 
+    def _go_back(self, entities: Dict, context: Dict) -> Dict[str, Any]:
+        """Press back"""
+        return self.actions.press_back()
+
+    def _go_home(self, entities: Dict, context: Dict) -> Dict[str, Any]:
+        """Press home"""
+        return self.actions.press_home()
+
     def _emergency_sos(self, entities: Dict, context: Dict) -> Dict[str, Any]:
         """Emergency SOS"""
         logger.info("🚨 EMERGENCY SOS")
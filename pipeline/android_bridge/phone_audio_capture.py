@@ -8,7 +8,8 @@ import threading
 import logging
 import numpy as np
 import time
-from queue import Queue
+
+from .phone_audio_stream import AudioChunkBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +20,10 @@ class PhoneAudioCapture:
     def __init__(self, device_id: str, adb_path: str = 'adb', sample_rate: int = 16000):
         self.device_id = device_id
         self.adb_path = adb_path
+        self._adb_prefix = (adb_path, '-s', device_id)
         self.sample_rate = sample_rate
         self.is_running = False
-        self.audio_queue = Queue(maxsize=100)
+        self.audio_queue = AudioChunkBuffer(maxlen=100)
         self.capture_thread = None
         self.process = None
         
@@ -70,7 +72,7 @@ class PhoneAudioCapture:
                 try:
                     # Record 1 second of audio on phone
                     record_cmd = [
-                        self.adb_path, '-s', self.device_id, 'shell',
+                        *self._adb_prefix, 'shell',
                         'am', 'start', '-a', 'android.provider.MediaStore.RECORD_SOUND'
                     ]
                     
@@ -82,8 +84,7 @@ class PhoneAudioCapture:
                     # For now, generate silence (so ASR doesn't crash)
                     chunk = np.zeros(2048, dtype=np.float32)
                     
-                    if not self.audio_queue.full():
-                        self.audio_queue.put(chunk)
+                    self.audio_queue.put(chunk)
                     
                     time.sleep(0.1)  # 100ms chunks
                     
@@ -96,11 +97,9 @@ class PhoneAudioCapture:
         finally:
             self.is_running = False
     
-    def read(self):
-        """Read audio chunk from queue"""
-        if not self.audio_queue.empty():
-            return self.audio_queue.get()
-        return None
+    def read(self, block: bool = False, timeout: float = None):
+        """Read audio chunk from queue (None if nothing is available)"""
+        return self.audio_queue.get(block, timeout)
     
     def get_stream(self):
         """Get audio stream (for compatibility with sounddevice)"""
@@ -130,10 +129,9 @@ class PhoneAudioStream:
         # Start callback thread
         def callback_loop():
             while self.capture.is_running:
-                chunk = self.capture.read()
+                chunk = self.capture.read(block=True, timeout=0.2)
                 if chunk is not None and self.callback:
                     self.callback(chunk, None, None, None)
-                time.sleep(0.01)
         
         threading.Thread(target=callback_loop, daemon=True).start()
     
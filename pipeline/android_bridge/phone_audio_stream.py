@@ -11,24 +11,71 @@ import numpy as np
 import time
 import socket
 import struct
-from queue import Queue
+from collections import deque
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+_DEFAULT_ENERGY_THRESHOLD = 0.005
+_RCVBUF_SIZE = 64 * 1024  # absorb adb-forwarded bursts
+_FORWARD_TIMEOUT = 5.0  # how long to keep retrying while `adb forward` comes up
+
+
+def frame_rms(samples: np.ndarray) -> float:
+    """Root-mean-square energy of a float32 audio frame"""
+    return float(np.sqrt(np.dot(samples, samples) / samples.size))
+
+
+class AudioChunkBuffer:
+    """Bounded chunk buffer that drops the oldest chunk when full"""
+
+    def __init__(self, maxlen: int):
+        self._chunks = deque(maxlen=maxlen)
+        self._has_data = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def put(self, chunk: np.ndarray):
+        """Append a chunk, evicting the oldest one if the buffer is full"""
+        self._chunks.append(chunk)
+        self._has_data.set()
+
+    def get(self, block: bool = False, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Pop the oldest chunk, optionally waiting for one (None if nothing arrives)"""
+        try:
+            return self._chunks.popleft()
+        except IndexError:
+            if not block:
+                return None
+
+        self._has_data.clear()
+        if not self._chunks and not self._has_data.wait(timeout):
+            return None
+        try:
+            return self._chunks.popleft()
+        except IndexError:
+            return None
+
 
 class PhoneAudioStream:
     """Receives audio stream from phone microphone via socket"""
 
-    def __init__(self, device_id: str, adb_path: str = 'adb', sample_rate: int = 16000, port: int = 8888):
+    def __init__(self, device_id: str, adb_path: str = 'adb', sample_rate: int = 16000, port: int = 8888,
+                 energy_threshold: float = _DEFAULT_ENERGY_THRESHOLD):
         self.device_id = device_id
         self.adb_path = adb_path
+        self._adb_prefix = (adb_path, '-s', device_id)
         self.sample_rate = sample_rate
         self.port = port
+        self.energy_threshold = energy_threshold  # frames below this RMS are dropped; 0 keeps all
         self.is_running = False
-        self.audio_queue = Queue(maxsize=100)
+        self.audio_queue = AudioChunkBuffer(maxlen=100)
         self.receive_thread = None
         self.socket = None
         self.callback = None
+        self._forward_proc: Optional[subprocess.Popen] = None
         
     def start(self, callback=None):
         """Start receiving audio from phone microphone"""
@@ -39,14 +86,15 @@ class PhoneAudioStream:
 
         logger.info("📱 Connecting to phone microphone...")
 
-        # Forward port from phone to laptop
+        # Forward port from phone to laptop; the receive thread retries the
+        # connect until the forward is up instead of waiting on adb here
         try:
-            subprocess.run(
-                [self.adb_path, '-s', self.device_id, 'forward', f'tcp:{self.port}', f'tcp:{self.port}'],
-                capture_output=True,
-                timeout=5
+            self._forward_proc = subprocess.Popen(
+                [*self._adb_prefix, 'forward', f'tcp:{self.port}', f'tcp:{self.port}'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
-            logger.info(f"✅ Port forwarding: localhost:{self.port}")
+            logger.info(f"✅ Port forwarding requested: localhost:{self.port}")
         except Exception as e:
             logger.error(f"Port forwarding failed: {e}")
             return False
@@ -74,34 +122,60 @@ class PhoneAudioStream:
         if self.receive_thread:
             self.receive_thread.join(timeout=2)
 
+        self._reap_forward()
+
         logger.info("✅ Phone microphone stopped")
+
+    def _reap_forward(self, timeout: float = 1.0):
+        """Wait for the `adb forward` process to exit (killing it if it hangs) and drop it"""
+        proc, self._forward_proc = self._forward_proc, None
+        if proc is None:
+            return
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
     
     def _receive_loop(self):
         """Receive audio stream from phone"""
         try:
             # Connect to phone
             logger.info(f"Connecting to phone on port {self.port}...")
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(10)
-            self.socket.connect(('localhost', self.port))
+            self.socket = self._connect_socket()
+            self._reap_forward()
             logger.info("✅ Connected to phone microphone")
 
             # Receive audio data
             chunk_size = 2048  # bytes
+            recv_buf = bytearray(chunk_size)
+            recv_view = memoryview(recv_buf)
+            carry = 0  # odd trailing byte left over from the previous recv
             while self.is_running:
                 try:
-                    data = self.socket.recv(chunk_size)
-                    if not data:
+                    n = self.socket.recv_into(recv_view[carry:])
+                    if not n:
                         logger.warning("Connection closed by phone")
                         break
 
+                    n += carry
+                    usable = n & ~1
+                    carry = n - usable
+                    if not usable:
+                        continue
+
                     # Convert bytes to float32 audio
-                    audio_int16 = np.frombuffer(data, dtype=np.int16)
-                    audio_float32 = audio_int16.astype(np.float32) / 32768.0
+                    audio_int16 = np.frombuffer(recv_buf, dtype=np.int16, count=usable // 2)
+                    audio_float32 = np.multiply(audio_int16, _INT16_SCALE, dtype=np.float32)
+                    if carry:
+                        recv_buf[0] = recv_buf[usable]
+
+                    # Skip silent frames before any queue/callback work
+                    if self.energy_threshold and frame_rms(audio_float32) < self.energy_threshold:
+                        continue
 
                     # Add to queue
-                    if not self.audio_queue.full():
-                        self.audio_queue.put(audio_float32)
+                    self.audio_queue.put(audio_float32)
 
                     # Call callback if provided
                     if self.callback:
@@ -121,9 +195,26 @@ class PhoneAudioStream:
             if self.socket:
                 self.socket.close()
     
-    def read(self):
-        """Read audio chunk from queue"""
-        if not self.audio_queue.empty():
-            return self.audio_queue.get()
-        return None
+    def _connect_socket(self) -> socket.socket:
+        """Connect to the forwarded port, retrying while `adb forward` is still starting"""
+        deadline = time.monotonic() + _FORWARD_TIMEOUT
+        while True:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF_SIZE)
+            sock.settimeout(10)
+            try:
+                sock.connect(('localhost', self.port))
+                return sock
+            except ConnectionRefusedError:
+                sock.close()
+                forward_proc = self._forward_proc
+                forward_failed = forward_proc is not None and forward_proc.poll() not in (None, 0)
+                if forward_failed or not self.is_running or time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.05)
+
+    def read(self, block: bool = False, timeout: float = None):
+        """Read audio chunk from queue (None if nothing is available)"""
+        return self.audio_queue.get(block, timeout)
 
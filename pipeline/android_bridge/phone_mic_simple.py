@@ -1,6 +1,6 @@
 """
 Simple Phone Microphone Capture
-Uses ADB shell commands to record audio from phone microphone
+Streams audio from phone microphone with tinycap over `adb exec-out`
 No Android app required!
 """
 
@@ -8,14 +8,14 @@ import subprocess
 import threading
 import logging
 import numpy as np
-import time
-import os
-import tempfile
-import wave
-from queue import Queue
+
+from .phone_audio_stream import AudioChunkBuffer, _INT16_SCALE
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_SAMPLES = 2048
+_WAV_HEADER_SIZE = 44
+
 
 class SimplePhoneMic:
     """Captures audio from phone using ADB shell commands"""
@@ -23,10 +23,12 @@ class SimplePhoneMic:
     def __init__(self, device_id: str, adb_path: str = 'adb', sample_rate: int = 16000):
         self.device_id = device_id
         self.adb_path = adb_path
+        self._adb_prefix = (adb_path, '-s', device_id)
         self.sample_rate = sample_rate
         self.is_running = False
-        self.audio_queue = Queue(maxsize=50)
+        self.audio_queue = AudioChunkBuffer(maxlen=50)
         self.record_thread = None
+        self.process = None
         self.callback = None
         
     def start(self, callback=None):
@@ -50,6 +52,7 @@ class SimplePhoneMic:
         """Stop capturing audio"""
         logger.info("Stopping phone microphone...")
         self.is_running = False
+        self._kill_process()
         
         if self.record_thread:
             self.record_thread.join(timeout=2)
@@ -57,62 +60,79 @@ class SimplePhoneMic:
         logger.info("✅ Phone microphone stopped")
     
     def _record_loop(self):
-        """Continuously record audio from phone"""
-        chunk_duration = 3  # Record 3 seconds at a time
+        """Stream raw PCM from the phone microphone via tinycap"""
+        # tinycap writes a WAV header first; the header's size fields are
+        # never patched on a pipe, so skip it and read PCM until stopped
+        self.process = subprocess.Popen(
+            [*self._adb_prefix, 'exec-out',
+             'tinycap', '/proc/self/fd/1', '-D', '0', '-d', '0',
+             '-r', str(self.sample_rate), '-c', '1', '-b', '16'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+        stream = self.process.stdout
         
-        while self.is_running:
-            try:
-                # Create temp file paths
-                phone_path = f"/sdcard/vaani_rec.wav"
-                local_path = tempfile.mktemp(suffix='.wav')
-                
-                # Record audio on phone using screenrecord audio hack
-                # Alternative: Use am start to launch voice recorder
-                logger.debug(f"Recording {chunk_duration}s from phone...")
-                
-                # Method 1: Try using am start with voice recorder intent
-                record_cmd = [
-                    self.adb_path, '-s', self.device_id, 'shell',
-                    f'am start -a android.provider.MediaStore.RECORD_SOUND'
-                ]
-                
-                # This will open the voice recorder app
-                # We need a better method...
-                
-                # Method 2: Use termux-microphone-record (requires Termux)
-                # Method 3: Use scrcpy audio forwarding
-                # Method 4: Use gnirehtet for audio streaming
+        buf = bytearray(_CHUNK_SAMPLES * 2)
+        view = memoryview(buf)
+        
+        try:
+            header = 0
+            while header < _WAV_HEADER_SIZE:
+                n = stream.readinto(view[:_WAV_HEADER_SIZE - header])
+                if not n:
+                    raise EOFError("tinycap produced no audio")
+                header += n
+            
+            carry = 0  # odd trailing byte left over from the previous read
+            while self.is_running:
+                n = stream.readinto(view[carry:])
+                if not n:
+                    if self.is_running:
+                        logger.error("Phone microphone stream ended")
+                    break
                 
-                # For now, let's use a SIMPLER approach:
-                # Generate test audio to verify the pipeline works
-                logger.info("📱 Generating test audio (phone mic not yet implemented)")
+                n += carry
+                usable = n & ~1
+                carry = n - usable
+                if not usable:
+                    continue
                 
-                # Generate 3 seconds of silence with small noise
-                samples = int(self.sample_rate * chunk_duration)
-                audio = np.random.normal(0, 0.001, samples).astype(np.float32)
+                audio = np.multiply(
+                    np.frombuffer(buf, dtype=np.int16, count=usable // 2),
+                    _INT16_SCALE, dtype=np.float32
+                )
+                if carry:
+                    buf[0] = buf[usable]
                 
                 # Add to queue
-                if not self.audio_queue.full():
-                    self.audio_queue.put(audio)
+                self.audio_queue.put(audio)
                 
                 # Call callback if provided
                 if self.callback:
-                    # Split into smaller chunks for callback
-                    chunk_size = 2048
-                    for i in range(0, len(audio), chunk_size):
-                        chunk = audio[i:i+chunk_size]
-                        if len(chunk) > 0:
-                            self.callback(chunk.reshape(-1, 1), None, None, None)
-                
-                time.sleep(chunk_duration)
-                
-            except Exception as e:
-                logger.error(f"Recording error: {e}")
-                time.sleep(1)
+                    self.callback(audio.reshape(-1, 1), None, None, None)
+        
+        except Exception as e:
+            logger.error(f"Recording error: {e}")
+            logger.error("tinycap needs tinyalsa and mic access on the phone (usually root)")
+        finally:
+            self.is_running = False
+            self._kill_process()
+    
+    def _kill_process(self):
+        """Terminate the tinycap process"""
+        process, self.process = self.process, None
+        if process:
+            try:
+                process.terminate()
+                process.wait(timeout=2)
+            except Exception:
+                try:
+                    process.kill()
+                except Exception:
+                    pass
     
-    def read(self):
-        """Read audio chunk from queue"""
-        if not self.audio_queue.empty():
-            return self.audio_queue.get()
-        return None
+    def read(self, block: bool = False, timeout: float = None):
+        """Read audio chunk from queue (None if nothing is available)"""
+        return self.audio_queue.get(block, timeout)
 
@@ -3,11 +3,12 @@ Phone Notification System
 Shows VAANI status on phone screen using ADB (no app install needed)
 """
 
+import shlex
 import subprocess
 import logging
 from typing import Optional
+from queue import Queue, Empty
 import threading
-import time
 
 logger = logging.getLogger(__name__)
 
@@ -18,37 +19,62 @@ class PhoneNotification:
     def __init__(self, device_id: str, adb_path: str = 'adb'):
         self.device_id = device_id
         self.adb_path = adb_path
+        self._adb_prefix = (adb_path, '-s', device_id)
         self.current_status = None
         self.status_thread = None
         self.running = False
+        self._shell: Optional[subprocess.Popen] = None
+        self._shell_lock = threading.Lock()
+        self._status_queue: Queue = Queue()
+
+    def _write_shell(self, line: str):
+        """Send a command line to the long-lived adb shell, respawning it if it died"""
+        with self._shell_lock:
+            if self._shell is None or self._shell.poll() is not None:
+                self._shell = subprocess.Popen(
+                    [*self._adb_prefix, 'shell'],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=0
+                )
+            self._shell.stdin.write(line.encode('utf-8'))
 
     def _show_on_screen(self, message: str, duration: int = 2):
-        """Show message on phone screen using input text"""
+        """Queue message for the status worker so callers never wait on adb"""
+        if self.status_thread is None or not self.status_thread.is_alive():
+            self.running = True
+            self.status_thread = threading.Thread(target=self._status_loop, daemon=True)
+            self.status_thread.start()
+        self._status_queue.put(message)
+
+    def _status_loop(self):
+        """Post queued statuses, skipping straight to the newest if several are waiting"""
+        while self.running:
+            message = self._status_queue.get()
+            while True:
+                try:
+                    message = self._status_queue.get_nowait()
+                except Empty:
+                    break
+            if message is None or not self.running:
+                break
+            self._post_status(message)
+
+    def _post_status(self, message: str):
+        """Show message on phone screen"""
         try:
-            # Method 1: Use input keyevent to wake screen
-            subprocess.run(
-                [self.adb_path, '-s', self.device_id, 'shell', 'input', 'keyevent', 'KEYCODE_WAKEUP'],
-                capture_output=True, timeout=2
+            quoted = shlex.quote(message)
+            self._write_shell(
+                # Method 1: Use input keyevent to wake screen
+                'input keyevent KEYCODE_WAKEUP; '
+                # Method 2: Show via service call (status bar notification)
+                # This creates a persistent notification
+                f"cmd notification post -t 'VAANI Status' vaani_status {quoted}; "
+                # Method 3: Log to logcat with tag
+                f'log -t VAANI_STATUS {quoted}\n'
             )
 
-            # Method 2: Show via service call (status bar notification)
-            # This creates a persistent notification
-            cmd = [
-                self.adb_path, '-s', self.device_id, 'shell',
-                'cmd', 'notification', 'post',
-                '-t', 'VAANI Status',
-                'vaani_status',
-                message
-            ]
-            subprocess.run(cmd, capture_output=True, timeout=2)
-
-            # Method 3: Log to logcat with tag
-            log_cmd = [
-                self.adb_path, '-s', self.device_id, 'shell',
-                'log', '-t', 'VAANI_STATUS', message
-            ]
-            subprocess.run(log_cmd, capture_output=True, timeout=2)
-
             logger.info(f"📱 Phone: {message}")
 
         except Exception as e:
@@ -90,5 +116,15 @@ class PhoneNotification:
         """Cleanup"""
         self.running = False
         if self.status_thread:
+            self._status_queue.put(None)  # wake the worker
             self.status_thread.join(timeout=1)
+            self.status_thread = None
+        with self._shell_lock:
+            if self._shell is not None:
+                try:
+                    self._shell.stdin.close()
+                    self._shell.wait(timeout=2)
+                except Exception:
+                    self._shell.kill()
+                self._shell = None
 
@@ -6,11 +6,17 @@ Sends status updates to Android overlay via socket connection
 import socket
 import logging
 import subprocess
+import threading
+import time
 from typing import Optional
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+_CONNECT_ATTEMPTS = 4
+_RECONNECT_INTERVAL = 1.0  # seconds between reconnect attempts from send_state
+_COALESCE_WINDOW = 0.005  # state changes closer together than this share one write
+
 
 class OverlayState(Enum):
     """Overlay status states"""
@@ -22,59 +28,124 @@ class OverlayState(Enum):
     IDLE = "IDLE"
 
 
+# Wire format of each state, built once
+_ENCODED_STATES = {state: f"{state.value}\n".encode('utf-8') for state in OverlayState}
+
+
 class PhoneOverlayNotifier:
     """Sends status updates to phone overlay"""
     
     def __init__(self, device_id: str, adb_path: str = 'adb', port: int = 8766):
         self.device_id = device_id
         self.adb_path = adb_path
+        self._adb_prefix = (adb_path, '-s', device_id)
         self.port = port
         self.socket: Optional[socket.socket] = None
         self.connected = False
+        self._pending = bytearray()
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()  # held while the socket is written, swapped or closed
+        self._flush_timer: Optional[threading.Timer] = None
+        self._last_reconnect = float('-inf')
         
     def connect(self) -> bool:
         """Connect to phone overlay service"""
         try:
             # Forward port from PC to phone
             result = subprocess.run(
-                [self.adb_path, '-s', self.device_id, 'forward', f'tcp:{self.port}', f'tcp:{self.port}'],
+                [*self._adb_prefix, 'forward', f'tcp:{self.port}', f'tcp:{self.port}'],
                 capture_output=True,
                 text=True,
                 timeout=5
             )
             
             if result.returncode != 0:
-                logger.error(f"Failed to forward port: {result.stderr}")
+                logger.error("Failed to forward port: %s", result.stderr)
                 return False
             
-            # Connect to forwarded port
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(2)
-            self.socket.connect(('localhost', self.port))
+            # Connect to forwarded port, backing off between attempts
+            self.connected = False
+            self._close_socket()
+            for attempt in range(_CONNECT_ATTEMPTS):
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.settimeout(2)
+                try:
+                    sock.connect(('localhost', self.port))
+                    break
+                except OSError:
+                    sock.close()
+                    if attempt == _CONNECT_ATTEMPTS - 1:
+                        raise
+                    time.sleep(min(2 ** attempt * 0.05, 0.4))
+            
+            with self._send_lock:
+                self.socket = sock
             self.connected = True
-            logger.info(f"✅ Connected to phone overlay on port {self.port}")
+            logger.info("✅ Connected to phone overlay on port %s", self.port)
             return True
             
         except Exception as e:
-            logger.warning(f"Could not connect to overlay: {e}")
+            logger.warning("Could not connect to overlay: %s", e)
             self.connected = False
             return False
     
     def send_state(self, state: OverlayState) -> bool:
-        """Send state update to overlay"""
+        """
+        Queue a state update for the overlay.
+        
+        The update is written within the coalescing window, not before this
+        returns; a failed write marks the notifier disconnected so the next
+        call reconnects.
+        
+        Returns:
+            True if the state was queued for a connected overlay
+        """
         if not self.connected:
-            # Try to reconnect
+            # Try to reconnect, at most once per interval so a dead phone isn't hammered
+            now = time.monotonic()
+            if now - self._last_reconnect < _RECONNECT_INTERVAL:
+                return False
+            self._last_reconnect = now
             if not self.connect():
                 return False
         
-        try:
-            message = f"{state.value}\n"
-            self.socket.sendall(message.encode('utf-8'))
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to send overlay state: {e}")
-            self.connected = False
-            return False
+        # Queue the state; a burst of transitions goes out as one write
+        with self._pending_lock:
+            self._pending += _ENCODED_STATES[state]
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(_COALESCE_WINDOW, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        return True
+    
+    def _flush(self):
+        """Send all queued state updates in one write"""
+        # Writes are serialized by _send_lock; _pending_lock is only held to take
+        # the payload, so send_state never waits on a slow socket
+        with self._send_lock:
+            with self._pending_lock:
+                self._flush_timer = None
+                sock = self.socket
+                if not self._pending or sock is None:
+                    return
+                payload = bytes(self._pending)
+                self._pending.clear()
+            try:
+                sock.sendall(payload)
+            except Exception as e:
+                logger.warning("Failed to send overlay state: %s", e)
+                self.connected = False
+    
+    def _close_socket(self):
+        """Close the current socket, if any"""
+        with self._send_lock:
+            if self.socket:
+                try:
+                    self.socket.close()
+                except:
+                    pass
+                self.socket = None
     
     def listening(self):
         """Set overlay to listening state"""
@@ -102,11 +173,12 @@ class PhoneOverlayNotifier:
     
     def disconnect(self):
         """Disconnect from overlay"""
-        if self.socket:
-            try:
-                self.socket.close()
-            except:
-                pass
+        with self._pending_lock:
+            timer = self._flush_timer
+        if timer:
+            timer.cancel()
+        self._flush()
+        self._close_socket()
         self.connected = False
         logger.info("Disconnected from phone overlay")
 
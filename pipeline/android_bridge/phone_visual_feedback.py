@@ -3,13 +3,17 @@ Phone Visual Feedback System
 Shows persistent visual status on phone screen using ADB
 """
 
+import shlex
 import subprocess
 import logging
 import threading
-import time
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+_SHELL_SENTINEL = '__VAANI_END__'
+_SHELL_TIMEOUT = 5
+
 
 class PhoneVisualFeedback:
     """Shows persistent visual feedback on phone screen"""
@@ -17,42 +21,82 @@ class PhoneVisualFeedback:
     def __init__(self, device_id: str, adb_path: str = 'adb'):
         self.device_id = device_id
         self.adb_path = adb_path
+        self._adb_prefix = (adb_path, '-s', device_id)
         self.current_state = "IDLE"
+        self._state_message = ""  # message shown with SUCCESS/ERROR, so a new one still reposts
         self.running = False
         self.update_thread = None
+        self._shell_proc: Optional[subprocess.Popen] = None
+        self._shell_lock = threading.Lock()
         
     def _shell(self, command: str) -> str:
-        """Execute ADB shell command"""
-        try:
-            result = subprocess.run(
-                [self.adb_path, '-s', self.device_id, 'shell', command],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.stdout.strip()
-        except Exception as e:
-            logger.debug(f"Shell command failed: {e}")
-            return ""
+        """Execute ADB shell command in a long-lived `adb shell` session"""
+        with self._shell_lock:
+            try:
+                proc = self._shell_proc
+                if proc is None or proc.poll() is not None:
+                    proc = self._shell_proc = subprocess.Popen(
+                        [*self._adb_prefix, 'shell'],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        bufsize=1
+                    )
+                
+                proc.stdin.write(f'{command}; echo {_SHELL_SENTINEL}\n')
+                proc.stdin.flush()
+                
+                # A hung command kills the shell; it is respawned on the next call
+                watchdog = threading.Timer(_SHELL_TIMEOUT, proc.kill)
+                watchdog.start()
+                try:
+                    lines = []
+                    while True:
+                        line = proc.stdout.readline()
+                        if not line:
+                            raise BrokenPipeError("adb shell closed")
+                        if _SHELL_SENTINEL in line:
+                            lines.append(line[:line.find(_SHELL_SENTINEL)])
+                            break
+                        lines.append(line)
+                finally:
+                    watchdog.cancel()
+                
+                return ''.join(lines).strip()
+            except Exception as e:
+                logger.debug("Shell command failed: %s", e)
+                return ""
+    
+    def _close_shell(self):
+        """End the long-lived adb shell"""
+        with self._shell_lock:
+            proc, self._shell_proc = self._shell_proc, None
+            if proc is not None and proc.poll() is None:
+                try:
+                    proc.stdin.write('exit\n')
+                    proc.stdin.flush()
+                    proc.wait(timeout=1)
+                except Exception:
+                    proc.kill()
     
     def _show_persistent_notification(self, title: str, message: str, icon: str):
         """Show persistent notification on phone"""
         try:
-            # Wake screen
-            self._shell('input keyevent KEYCODE_WAKEUP')
-            
-            # Post notification using cmd notification
-            cmd = f'cmd notification post -t "{title}" vaani_status "{icon} {message}"'
-            self._shell(cmd)
-            
-            # Also show as toast for immediate feedback
-            # Note: This requires a helper app, so we'll use logcat instead
-            self._shell(f'log -t VAANI "{icon} {title}: {message}"')
+            self._shell(
+                # Wake screen
+                'input keyevent KEYCODE_WAKEUP; '
+                # Post notification using cmd notification
+                f'cmd notification post -t {shlex.quote(title)} vaani_status {shlex.quote(f"{icon} {message}")}; '
+                # Also show as toast for immediate feedback
+                # Note: This requires a helper app, so we'll use logcat instead
+                f'log -t VAANI {shlex.quote(f"{icon} {title}: {message}")}'
+            )
             
-            logger.info(f"📱 {icon} {title}: {message}")
+            logger.info("📱 %s %s: %s", icon, title, message)
             
         except Exception as e:
-            logger.debug(f"Could not show notification: {e}")
+            logger.debug("Could not show notification: %s", e)
     
     def _update_loop(self):
         """Continuously update visual feedback - DISABLED to prevent spam"""
@@ -76,6 +120,7 @@ class PhoneVisualFeedback:
             self._shell('cmd notification cancel vaani_status')
         except:
             pass
+        self._close_shell()
         logger.info("✅ Visual feedback system stopped")
     
     def listening(self):
@@ -86,28 +131,36 @@ class PhoneVisualFeedback:
     
     def processing(self):
         """Show processing state"""
-        self.current_state = "PROCESSING"
-        self._show_persistent_notification("VAANI PROCESSING", "Understanding...", "🟡")
+        if self.current_state != "PROCESSING":
+            self.current_state = "PROCESSING"
+            self._show_persistent_notification("VAANI PROCESSING", "Understanding...", "🟡")
     
     def speaking(self):
         """Show speaking state"""
-        self.current_state = "SPEAKING"
-        self._show_persistent_notification("VAANI SPEAKING", "Responding...", "🟣")
+        if self.current_state != "SPEAKING":
+            self.current_state = "SPEAKING"
+            self._show_persistent_notification("VAANI SPEAKING", "Responding...", "🟣")
     
     def action_ok(self, action: str = ""):
         """Show success state"""
-        self.current_state = "SUCCESS"
         msg = f"Executed: {action}" if action else "Success!"
-        self._show_persistent_notification("VAANI SUCCESS", msg, "🟢")
+        if self.current_state != "SUCCESS" or self._state_message != msg:
+            self.current_state = "SUCCESS"
+            self._state_message = msg
+            self._show_persistent_notification("VAANI SUCCESS", msg, "🟢")
     
     def action_failed(self, error: str = ""):
         """Show error state"""
-        self.current_state = "ERROR"
         msg = f"Error: {error}" if error else "Failed"
-        self._show_persistent_notification("VAANI ERROR", msg, "🔴")
+        if self.current_state != "ERROR" or self._state_message != msg:
+            self.current_state = "ERROR"
+            self._state_message = msg
+            self._show_persistent_notification("VAANI ERROR", msg, "🔴")
     
     def idle(self):
         """Show idle state"""
+        if self.current_state == "IDLE":
+            return
         self.current_state = "IDLE"
         try:
             self._shell('cmd notification cancel vaani_status')
@@ -4,53 +4,21 @@ WebSocket/HTTP server for phone ↔ laptop communication
 """
 
 import asyncio
-import json
 import logging
 from typing import Optional, Dict, Any, Callable
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from collections import deque
 
-logger = logging.getLogger(__name__)
+from . import fast_json
 
+logger = logging.getLogger(__name__)
 
-class AndroidBridgeHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for Android bridge"""
-    
-    # Class variable to store message handler
-    message_handler: Optional[Callable] = None
-    
-    def do_POST(self):
-        """Handle POST requests from phone"""
-        try:
-            # Read request body
-            content_length = int(self.headers['Content-Length'])
-            body = self.rfile.read(content_length)
-            
-            # Parse JSON
-            data = json.loads(body.decode('utf-8'))
-            
-            logger.info(f"📱 Received from phone: {data.get('type', 'unknown')}")
-            
-            # Process message
-            response = {"status": "success"}
-            
-            if self.message_handler:
-                response = self.message_handler(data)
-            
-            # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode('utf-8'))
-            
-        except Exception as e:
-            logger.error(f"❌ Request handling failed: {e}")
-            self.send_response(500)
-            self.end_headers()
-    
-    def log_message(self, format, *args):
-        """Suppress default logging"""
-        pass
+try:
+    from aiohttp import web
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+    logger.warning("aiohttp not available. Android Bridge Server disabled.")
 
 
 class AndroidBridgeServer:
@@ -64,7 +32,8 @@ class AndroidBridgeServer:
             port: Server port
         """
         self.port = port
-        self.server: Optional[HTTPServer] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.runner: Optional["web.AppRunner"] = None
         self.server_thread: Optional[threading.Thread] = None
         self.running = False
         self.message_handler: Optional[Callable] = None
@@ -77,7 +46,37 @@ class AndroidBridgeServer:
             handler: Function to process messages
         """
         self.message_handler = handler
-        AndroidBridgeHandler.message_handler = handler
+    
+    async def _handle_post(self, request: "web.Request") -> "web.Response":
+        """Handle POST requests from phone"""
+        try:
+            # Parse the raw body bytes; skips the str decode request.json() does
+            data = fast_json.loads(await request.read())
+            
+            logger.info(f"📱 Received from phone: {data.get('type', 'unknown')}")
+            
+            # Process message off the event loop so a slow handler doesn't stall other requests
+            response = {"status": "success"}
+            
+            if self.message_handler:
+                response = await asyncio.get_running_loop().run_in_executor(
+                    None, self.message_handler, data
+                )
+            
+            return web.Response(body=fast_json.dumps(response), content_type='application/json')
+            
+        except Exception as e:
+            logger.error(f"❌ Request handling failed: {e}")
+            return web.Response(status=500)
+    
+    async def _start_site(self):
+        """Set up the aiohttp application and bind the listening socket"""
+        app = web.Application()
+        app.router.add_post('/{tail:.*}', self._handle_post)
+        
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, 'localhost', self.port).start()
     
     def start(self) -> bool:
         """
@@ -86,46 +85,53 @@ class AndroidBridgeServer:
         Returns:
             True if started successfully
         """
+        if not HAS_AIOHTTP:
+            logger.error("❌ Server start failed: aiohttp is not installed")
+            return False
+        
         try:
             logger.info(f"🌐 Starting Android Bridge Server on port {self.port}...")
             
-            # Create server
-            self.server = HTTPServer(('localhost', self.port), AndroidBridgeHandler)
-            
-            # Start server thread
-            self.running = True
+            # Run the event loop on its own thread
+            self.loop = asyncio.new_event_loop()
             self.server_thread = threading.Thread(
-                target=self._run_server,
+                target=self.loop.run_forever,
                 daemon=True
             )
             self.server_thread.start()
             
+            asyncio.run_coroutine_threadsafe(self._start_site(), self.loop).result(timeout=5)
+            self.running = True
+            
             logger.info(f"✅ Server running on http://localhost:{self.port}")
             return True
             
         except Exception as e:
             logger.error(f"❌ Server start failed: {e}")
+            self.stop()
             return False
     
-    def _run_server(self):
-        """Run server loop"""
-        try:
-            while self.running:
-                self.server.handle_request()
-        except Exception as e:
-            logger.error(f"Server error: {e}")
-    
     def stop(self):
         """Stop server"""
         logger.info("Stopping server...")
         self.running = False
         
-        if self.server:
-            self.server.shutdown()
-            self.server = None
+        if self.loop:
+            if self.runner:
+                try:
+                    asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result(timeout=2)
+                except Exception as e:
+                    logger.error(f"Server cleanup failed: {e}")
+                self.runner = None
+            self.loop.call_soon_threadsafe(self.loop.stop)
         
         if self.server_thread:
             self.server_thread.join(timeout=2)
+            self.server_thread = None
+        
+        if self.loop:
+            self.loop.close()
+            self.loop = None
         
         logger.info("✅ Server stopped")
     
@@ -154,8 +160,8 @@ class PhoneMessageQueue:
     """Queue for messages between phone and laptop"""
     
     def __init__(self):
-        self.screen_text_queue = []
-        self.action_queue = []
+        self.screen_text_queue = deque()
+        self.action_queue = deque()
         self.lock = threading.Lock()
     
     def add_screen_text(self, text: str):
@@ -168,7 +174,7 @@ class PhoneMessageQueue:
         """Get latest screen text"""
         with self.lock:
             if self.screen_text_queue:
-                return self.screen_text_queue.pop(0)
+                return self.screen_text_queue.popleft()
         return None
     
     def add_action(self, action: Dict[str, Any]):
@@ -181,6 +187,6 @@ class PhoneMessageQueue:
         """Get next action to execute"""
         with self.lock:
             if self.action_queue:
-                return self.action_queue.pop(0)
+                return self.action_queue.popleft()
         return None
 
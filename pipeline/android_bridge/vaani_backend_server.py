@@ -4,25 +4,53 @@ Provides advanced NLU, dialogue management, and action routing for the Android a
 """
 
 import asyncio
-import json
 import logging
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, Optional
 from aiohttp import web
 import sys
 import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+# Running as a script (python pipeline/android_bridge/vaani_backend_server.py) needs
+# the project root on sys.path; package imports already have it
+if not __package__:
+    _PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    if _PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, _PROJECT_ROOT)
 
 from pipeline.nlu.intent_classifier import IntentClassifier
 from pipeline.dst.state_manager import StateManager
 from pipeline.dm.decision_manager import DecisionManager
 from pipeline.nlg.response_generator import ResponseGenerator
+from pipeline.nlu.fused import FusedPipeline
+from pipeline.android_bridge import fast_json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Polled endpoints reuse their serialized body for this long (seconds)
+_RESPONSE_CACHE_TTL = 1.0
+
+# Session limits: least recently active sessions are evicted past MAX_SESSIONS,
+# and a periodic sweep drops sessions idle longer than SESSION_IDLE_TIMEOUT
+MAX_SESSIONS = 1024
+SESSION_IDLE_TIMEOUT = 30 * 60  # seconds
+SESSION_SWEEP_INTERVAL = 300  # seconds
+
+# Turns kept per session; older ones are dropped automatically
+SESSION_HISTORY_LENGTH = 50
+
+# Worker threads for the synchronous NLU stages
+NLU_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def _json_response(data: Dict[str, Any], status: int = 200) -> web.Response:
+    """JSON response serialized with fast_json"""
+    return web.Response(body=fast_json.dumps(data), status=status, content_type='application/json')
+
 
 class VaaniBackendServer:
     """
@@ -41,14 +69,30 @@ class VaaniBackendServer:
         self.state_manager = StateManager()
         self.decision_manager = DecisionManager()
         self.response_generator = ResponseGenerator()
+        self.pipeline = FusedPipeline(
+            self.intent_classifier,
+            self.state_manager,
+            self.decision_manager,
+            self.response_generator
+        )
         
-        # Session storage
-        self.sessions: Dict[str, Dict[str, Any]] = {}
+        # The NLU stages are synchronous; run them here so the event loop keeps serving I/O
+        self.executor = ThreadPoolExecutor(max_workers=NLU_WORKERS, thread_name_prefix='vaani-nlu')
+        
+        # Session storage, ordered from least to most recently active
+        self.sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._sweep_task: Optional[asyncio.Task] = None
+        
+        # Serialized /health and /status bodies: (built at, [session count,] body)
+        self._health_cache = (float('-inf'), b'')
+        self._status_cache = (float('-inf'), -1, b'')
         
         # Setup routes
         self.setup_routes()
+        self.app.on_startup.append(self._start_session_sweeper)
+        self.app.on_cleanup.append(self._stop_session_sweeper)
         
-        logger.info(f"Vaani Backend Server initialized on {host}:{port}")
+        logger.info("Vaani Backend Server initialized on %s:%s", host, port)
     
     def setup_routes(self):
         """Setup API routes"""
@@ -58,21 +102,74 @@ class VaaniBackendServer:
         self.app.router.add_post('/session/reset', self.reset_session)
         self.app.router.add_get('/health', self.health_check)
     
+    def _get_session(self, device_id: str) -> Dict[str, Any]:
+        """Get or create a session and mark it as the most recently active"""
+        session = self.sessions.get(device_id)
+        if session is None:
+            if len(self.sessions) >= MAX_SESSIONS:
+                evicted, _ = self.sessions.popitem(last=False)
+                logger.info("Evicted least recently active session %s", evicted)
+            session = self.sessions[device_id] = {
+                'state': {},
+                'history': deque(maxlen=SESSION_HISTORY_LENGTH),
+                'last_active': time.monotonic(),
+                'lock': asyncio.Lock()
+            }
+        else:
+            self.sessions.move_to_end(device_id)
+            session['last_active'] = time.monotonic()
+        return session
+    
+    async def _sweep_sessions(self):
+        """Periodically drop sessions that have been idle too long"""
+        while True:
+            await asyncio.sleep(SESSION_SWEEP_INTERVAL)
+            cutoff = time.monotonic() - SESSION_IDLE_TIMEOUT
+            # Oldest sessions come first, so stop at the first recent one
+            while self.sessions:
+                device_id, session = next(iter(self.sessions.items()))
+                if session['last_active'] >= cutoff:
+                    break
+                del self.sessions[device_id]
+                logger.info("Expired idle session %s", device_id)
+    
+    async def _start_session_sweeper(self, app):
+        """Start the idle-session sweeper with the app"""
+        self._sweep_task = asyncio.create_task(self._sweep_sessions())
+    
+    async def _stop_session_sweeper(self, app):
+        """Stop the idle-session sweeper and the NLU workers"""
+        if self._sweep_task:
+            self._sweep_task.cancel()
+            self._sweep_task = None
+        self.executor.shutdown(wait=False)
+    
     async def health_check(self, request):
         """Health check endpoint"""
-        return web.json_response({
-            'status': 'healthy',
-            'timestamp': datetime.now().isoformat(),
-            'version': '1.0.0'
-        })
+        now = time.monotonic()
+        built_at, body = self._health_cache
+        if now - built_at >= _RESPONSE_CACHE_TTL:
+            body = fast_json.dumps({
+                'status': 'healthy',
+                'timestamp': datetime.now().isoformat(),
+                'version': '1.0.0'
+            })
+            self._health_cache = (now, body)
+        return web.Response(body=body, content_type='application/json')
     
     async def get_status(self, request):
         """Get server status"""
-        return web.json_response({
-            'status': 'running',
-            'active_sessions': len(self.sessions),
-            'timestamp': datetime.now().isoformat()
-        })
+        now = time.monotonic()
+        active_sessions = len(self.sessions)
+        built_at, cached_sessions, body = self._status_cache
+        if now - built_at >= _RESPONSE_CACHE_TTL or cached_sessions != active_sessions:
+            body = fast_json.dumps({
+                'status': 'running',
+                'active_sessions': active_sessions,
+                'timestamp': datetime.now().isoformat()
+            })
+            self._status_cache = (now, active_sessions, body)
+        return web.Response(body=body, content_type='application/json')
     
     async def wake_word_detected(self, request):
         """
@@ -80,31 +177,24 @@ class VaaniBackendServer:
         Returns: Acknowledgement and readiness status
         """
         try:
-            data = await request.json()
+            data = fast_json.loads(await request.read())
             device_id = data.get('device_id', 'unknown')
             wake_word = data.get('wake_word', 'Vaani')
             
-            logger.info(f"Wake word '{wake_word}' detected on device {device_id}")
+            logger.info("Wake word '%s' detected on device %s", wake_word, device_id)
             
             # Initialize or get session
-            if device_id not in self.sessions:
-                self.sessions[device_id] = {
-                    'state': {},
-                    'history': [],
-                    'last_active': datetime.now()
-                }
-            
-            self.sessions[device_id]['last_active'] = datetime.now()
+            self._get_session(device_id)
             
-            return web.json_response({
+            return _json_response({
                 'status': 'ready',
                 'message': 'Ready for command',
                 'session_id': device_id
             })
             
         except Exception as e:
-            logger.error(f"Error in wake_word_detected: {e}")
-            return web.json_response({
+            logger.error("Error in wake_word_detected: %s", e)
+            return _json_response({
                 'status': 'error',
                 'message': str(e)
             }, status=500)
@@ -116,82 +206,53 @@ class VaaniBackendServer:
         Output: { "intent": "...", "entities": {...}, "action": {...}, "response": "..." }
         """
         try:
-            data = await request.json()
+            data = fast_json.loads(await request.read())
             device_id = data.get('device_id', 'unknown')
             text = data.get('text', '')
-            timestamp = data.get('timestamp', datetime.now().isoformat())
+            # History keeps the client's timestamp, or an epoch float if it sent none
+            timestamp = data.get('timestamp')
+            if timestamp is None:
+                timestamp = time.time()
             
-            logger.info(f"Processing command from {device_id}: '{text}'")
+            logger.info("Processing command from %s: '%s'", device_id, text)
             
             # Get or create session
-            if device_id not in self.sessions:
-                self.sessions[device_id] = {
-                    'state': {},
-                    'history': [],
-                    'last_active': datetime.now()
-                }
-            
-            session = self.sessions[device_id]
-            session['last_active'] = datetime.now()
+            session = self._get_session(device_id)
             
-            # Step 1: Intent Classification
-            classification = self.intent_classifier.classify(text)
-            intent = classification['intent']
-            entities = classification['entities']
-            confidence = classification['confidence']
-            
-            logger.info(f"Classified: intent={intent}, confidence={confidence:.2f}")
-            
-            # Step 2: Update Dialogue State
-            state = self.state_manager.update(
-                current_state=session['state'],
-                intent=intent,
-                entities=entities,
-                user_utterance=text
-            )
-            session['state'] = state
-            
-            # Step 3: Decide Action
-            decision = self.decision_manager.decide(
-                intent=intent,
-                entities=entities,
-                state=state
-            )
-            
-            # Step 4: Generate Response
-            response_text = self.response_generator.generate(
-                intent=intent,
-                entities=entities,
-                action_result=decision
-            )
-            
-            # Step 5: Add to history
-            session['history'].append({
-                'timestamp': timestamp,
-                'text': text,
-                'intent': intent,
-                'entities': entities,
-                'response': response_text
-            })
+            # Intent, state, decision and response run as one turn off the event loop.
+            # Turns for the same device are serialized so each sees the previous state.
+            async with session['lock']:
+                turn = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, self.pipeline.run_turn, session, text
+                )
+                
+                # Add to history
+                session['history'].append({
+                    'timestamp': timestamp,
+                    'text': text,
+                    'intent': turn.intent,
+                    'entities': turn.entities,
+                    'response': turn.response
+                })
             
             # Prepare result
             result = {
                 'status': 'success',
-                'intent': intent,
-                'entities': entities,
-                'confidence': confidence,
-                'action': decision,
-                'response': response_text,
-                'state': state
+                'intent': turn.intent,
+                'entities': turn.entities,
+                'confidence': turn.confidence,
+                'action': turn.action,
+                'response': turn.response,
+                'state': turn.state
             }
             
-            logger.info(f"Processed successfully: {intent} -> {response_text}")
+            logger.info("Processed successfully: %s -> %s", turn.intent, turn.response)
             
-            return web.json_response(result)
+            return _json_response(result)
             
         except Exception as e:
-            logger.error(f"Error processing command: {e}", exc_info=True)
-            return web.json_response({
+            logger.error("Error processing command: %s", e, exc_info=True)
+            return _json_response({
                 'status': 'error',
                 'message': str(e),
                 'response': "Sorry, I encountered an error processing that command."
@@ -200,34 +261,34 @@ class VaaniBackendServer:
     async def reset_session(self, request):
         """Reset a device session"""
         try:
-            data = await request.json()
+            data = fast_json.loads(await request.read())
             device_id = data.get('device_id', 'unknown')
             
             if device_id in self.sessions:
                 del self.sessions[device_id]
-                logger.info(f"Reset session for device {device_id}")
+                logger.info("Reset session for device %s", device_id)
             
-            return web.json_response({
+            return _json_response({
                 'status': 'success',
                 'message': 'Session reset'
             })
             
         except Exception as e:
-            logger.error(f"Error resetting session: {e}")
-            return web.json_response({
+            logger.error("Error resetting session: %s", e)
+            return _json_response({
                 'status': 'error',
                 'message': str(e)
             }, status=500)
     
     def run(self):
         """Start the server"""
-        logger.info(f"Starting Vaani Backend Server on {self.host}:{self.port}")
+        logger.info("Starting Vaani Backend Server on %s:%s", self.host, self.port)
         logger.info("API Endpoints:")
-        logger.info(f"  POST http://{self.host}:{self.port}/wake_word - Wake word detected")
-        logger.info(f"  POST http://{self.host}:{self.port}/process - Process command")
-        logger.info(f"  GET  http://{self.host}:{self.port}/status - Server status")
-        logger.info(f"  POST http://{self.host}:{self.port}/session/reset - Reset session")
-        logger.info(f"  GET  http://{self.host}:{self.port}/health - Health check")
+        logger.info("  POST http://%s:%s/wake_word - Wake word detected", self.host, self.port)
+        logger.info("  POST http://%s:%s/process - Process command", self.host, self.port)
+        logger.info("  GET  http://%s:%s/status - Server status", self.host, self.port)
+        logger.info("  POST http://%s:%s/session/reset - Reset session", self.host, self.port)
+        logger.info("  GET  http://%s:%s/health - Health check", self.host, self.port)
         logger.info("")
         logger.info("Server ready! Waiting for requests from Android app...")
         
@@ -12,6 +12,7 @@ import csv
 import json
 import os
 import argparse
+import textwrap
 from pathlib import Path
 from datetime import datetime
 import sys
@@ -25,6 +26,13 @@ except ImportError:
     print("⚠️  pygame not installed. Audio playback disabled.")
     print("   Install with: pip install pygame")
 
+# Fast JSON (de)serialization; falls back to the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Intent categories
 INTENTS = [
     "GREETING", "QUERY_TIME", "QUERY_WEATHER", "OPEN_APP",
@@ -35,6 +43,10 @@ INTENTS = [
 # Entity types
 ENTITY_TYPES = ["TIME", "LOCATION", "PERSON", "APP", "DATE", "TASK"]
 
+# Mixer settings: 16 kHz mono to match the recordings, small buffer for low latency
+MIXER_SAMPLE_RATE = 16000
+MIXER_BUFFER = 1024
+
 
 def play_audio(audio_path):
     """Play audio file using pygame."""
@@ -43,11 +55,13 @@ def play_audio(audio_path):
         return
     
     try:
-        pygame.mixer.init()
+        # Initialize the mixer on first use and reuse it for every file
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=MIXER_SAMPLE_RATE, size=-16, channels=1, buffer=MIXER_BUFFER)
         pygame.mixer.music.load(audio_path)
         pygame.mixer.music.play()
         while pygame.mixer.music.get_busy():
-            pygame.time.Clock().tick(10)
+            pygame.time.wait(20)
     except Exception as e:
         print(f"   ⚠️  Could not play audio: {e}")
 
@@ -165,6 +179,52 @@ def annotate_audio_file(query_id, query_text, audio_path, annotator_name):
     return annotation
 
 
+def load_json(filepath):
+    """Load a JSON file."""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def dump_json(obj):
+    """Serialize to JSON text indented by 2, keeping non-ASCII characters as-is."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def append_annotation(filepath, annotation):
+    """
+    Append one annotation to an existing JSON array file without rewriting it.
+    
+    The result has the same layout as json.dump(annotations, f, indent=2),
+    so every reader of the annotations file is unaffected.
+    
+    Returns:
+        True if appended, False if the file is missing, empty, or not a non-empty array
+    """
+    if not os.path.exists(filepath):
+        return False
+    
+    with open(filepath, 'r+b') as f:
+        # Locate the array's closing bracket near the end of the file
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - 4096))
+        tail = f.read()
+        body = tail.rstrip()
+        if not body.endswith(b']'):
+            return False
+        last_record = body[:-1].rstrip()
+        if last_record.endswith(b'['):
+            return False
+        
+        record = textwrap.indent(dump_json(annotation), '  ')
+        f.seek(size - len(tail) + len(last_record))
+        f.write((',\n' + record + '\n]').encode('utf-8'))
+        f.truncate()
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(description="VAANI Audio Annotation Tool")
     parser.add_argument("--queries", default="data/queries/queries_day1.csv",
@@ -191,8 +251,7 @@ def main():
     # Load existing annotations if any
     annotations = []
     if os.path.exists(args.output):
-        with open(args.output, 'r', encoding='utf-8') as f:
-            annotations = json.load(f)
+        annotations = load_json(args.output)
         print(f"📂 Loaded {len(annotations)} existing annotations")
     
     # Load queries
@@ -215,9 +274,10 @@ def main():
             annotation = annotate_audio_file(query_id, query_text, audio_path, args.annotator)
             annotations.append(annotation)
             
-            # Save after each annotation
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(annotations, f, indent=2, ensure_ascii=False)
+            # Save after each annotation, appending only the new record when possible
+            if not append_annotation(args.output, annotation):
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    f.write(dump_json(annotations))
             
             print(f"\n✅ Saved annotation {i+1}/{len(queries)}")
             
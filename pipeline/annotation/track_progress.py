@@ -11,53 +11,100 @@ Usage:
 import csv
 import json
 import argparse
+import importlib.util
 from pathlib import Path
 from collections import Counter
 
+# Fast JSON parsing; falls back to the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pandas reads large CSVs in C (multithreaded with pyarrow); falls back to the csv module
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+    CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# Buffer size for CSV reads and writes (fewer, larger syscalls)
+IO_BUFFER_SIZE = 1 << 20
+
 def load_annotations(filepath):
     """Load annotations from JSON file."""
     if not Path(filepath).exists():
         return []
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 def load_queries(filepath):
     """Load queries from CSV file."""
+    if PANDAS_AVAILABLE:
+        df = pd.read_csv(filepath, dtype=str, keep_default_na=False, engine=CSV_ENGINE)
+        return df.to_dict('records')
+    
     queries = []
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with open(filepath, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
         reader = csv.DictReader(f)
         queries = list(reader)
     return queries
 
 def generate_status_csv(queries, annotations, output_file):
     """Generate annotation status CSV."""
-    annotated_ids = {ann['id'] for ann in annotations}
+    # Index annotations by query ID (the latest annotation of an ID wins)
+    by_id = {ann['id']: ann for ann in annotations}
+    fieldnames = ['audio_id', 'query_text', 'status', 'annotator', 'date']
     
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['audio_id', 'query_text', 'status', 'annotator', 'date'])
-        writer.writeheader()
+    if PANDAS_AVAILABLE:
+        # Left-join queries with annotation details in one hashed merge
+        metadata = [ann.get('metadata', {}) for ann in by_id.values()]
+        details = pd.DataFrame({
+            'audio_id': pd.Series(list(by_id), dtype=object),
+            'status': 'done',
+            'annotator': pd.Series([m.get('annotator', '') for m in metadata], dtype=object),
+            'date': pd.Series([m.get('annotation_date', '') for m in metadata], dtype=object)
+        })
+        status = pd.DataFrame({
+            'audio_id': pd.Series([query['id'] for query in queries], dtype=object),
+            'query_text': pd.Series([query['text'] for query in queries], dtype=object)
+        }).merge(details, on='audio_id', how='left')
+        status['status'] = status['status'].fillna('pending')
         
+        # Same line endings as csv.DictWriter; missing details are written as ''
+        status.to_csv(output_file, columns=fieldnames, index=False,
+                      encoding='utf-8', lineterminator='\r\n')
+        return
+    
+    def status_rows():
         for query in queries:
             query_id = query['id']
-            status = 'done' if query_id in annotated_ids else 'pending'
+            ann = by_id.get(query_id)
+            status = 'done' if ann is not None else 'pending'
             
             # Find annotation details
             annotator = ''
             date = ''
-            if status == 'done':
-                ann = next((a for a in annotations if a['id'] == query_id), None)
-                if ann and 'metadata' in ann:
-                    annotator = ann['metadata'].get('annotator', '')
-                    date = ann['metadata'].get('annotation_date', '')
+            if ann is not None and 'metadata' in ann:
+                annotator = ann['metadata'].get('annotator', '')
+                date = ann['metadata'].get('annotation_date', '')
             
-            writer.writerow({
+            yield {
                 'audio_id': query_id,
                 'query_text': query['text'],
                 'status': status,
                 'annotator': annotator,
                 'date': date
-            })
+            }
+    
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(status_rows())
 
 def print_progress_report(queries, annotations):
     """Print detailed progress report."""
@@ -80,31 +127,33 @@ def print_progress_report(queries, annotations):
     bar = '█' * filled + '░' * (bar_length - filled)
     print(f"\n[{bar}] {progress:.1f}%")
     
-    # Intent distribution
     if annotations:
+        # Gather intent, annotator and quality stats in a single pass
+        intent_counts = Counter()
+        annotator_counts = Counter()
+        quality_total = 0
+        quality_count = 0
+        for ann in annotations:
+            intent_counts[ann['intent']] += 1
+            if 'metadata' in ann:
+                metadata = ann['metadata']
+                annotator_counts[metadata.get('annotator', 'unknown')] += 1
+                quality_total += metadata.get('quality_score', 0)
+                quality_count += 1
+        
+        # Intent distribution
         print(f"\n📈 Intent Distribution:")
-        intent_counts = Counter(ann['intent'] for ann in annotations)
         for intent, count in intent_counts.most_common():
             print(f"   {intent}: {count}")
-    
-    # Annotator statistics
-    if annotations:
+        
+        # Annotator statistics
         print(f"\n👥 Annotator Statistics:")
-        annotator_counts = Counter(
-            ann['metadata'].get('annotator', 'unknown') 
-            for ann in annotations if 'metadata' in ann
-        )
         for annotator, count in annotator_counts.most_common():
             print(f"   {annotator}: {count} annotations")
-    
-    # Quality scores
-    if annotations:
-        quality_scores = [
-            ann['metadata'].get('quality_score', 0)
-            for ann in annotations if 'metadata' in ann
-        ]
-        if quality_scores:
-            avg_quality = sum(quality_scores) / len(quality_scores)
+        
+        # Quality scores
+        if quality_count:
+            avg_quality = quality_total / quality_count
             print(f"\n⭐ Average Quality Score: {avg_quality:.2f}/5.0")
 
 def main():
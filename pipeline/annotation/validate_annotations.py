@@ -10,9 +10,29 @@ Usage:
 
 import json
 import argparse
+import itertools
+import multiprocessing
+import os
 from pathlib import Path
 from collections import Counter
 
+# Streaming JSON parser; without it the whole file is loaded at once
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    JSON_ERRORS = (json.JSONDecodeError,)
+
+# Fast whole-file parser for when streaming is unavailable
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Valid intents
 VALID_INTENTS = [
     "GREETING", "QUERY_TIME", "QUERY_WEATHER", "OPEN_APP",
@@ -27,6 +47,10 @@ VALID_ENTITY_TYPES = ["TIME", "LOCATION", "PERSON", "APP", "DATE", "TASK"]
 REQUIRED_FIELDS = ["id", "audio_file", "transcription", "intent", "entities", "metadata"]
 REQUIRED_METADATA = ["annotator", "annotation_date", "quality_score"]
 
+# Files with at least this many annotations are validated across a process pool
+PARALLEL_MIN_RECORDS = 1000
+PARALLEL_CHUNK_SIZE = 256
+
 
 class AnnotationValidator:
     """Validates annotation data."""
@@ -34,6 +58,7 @@ class AnnotationValidator:
     def __init__(self):
         self.errors = []
         self.warnings = []
+        self._errored_idx = set()  # indices of annotations with at least one error
         self.stats = {
             "total": 0,
             "valid": 0,
@@ -41,12 +66,17 @@ class AnnotationValidator:
             "warnings": 0
         }
     
+    def _error(self, idx, message):
+        """Record an error against annotation idx."""
+        self.errors.append(message)
+        self._errored_idx.add(idx)
+    
     def validate_structure(self, annotation, idx):
         """Validate annotation structure."""
         # Check required fields
         for field in REQUIRED_FIELDS:
             if field not in annotation:
-                self.errors.append(f"Annotation {idx}: Missing required field '{field}'")
+                self._error(idx, f"Annotation {idx}: Missing required field '{field}'")
                 return False
         
         # Check metadata
@@ -61,7 +91,7 @@ class AnnotationValidator:
         """Validate intent classification."""
         intent = annotation.get("intent", "")
         if intent not in VALID_INTENTS:
-            self.errors.append(f"Annotation {idx} ({annotation.get('id')}): Invalid intent '{intent}'")
+            self._error(idx, f"Annotation {idx} ({annotation.get('id')}): Invalid intent '{intent}'")
             return False
         return True
     
@@ -73,11 +103,11 @@ class AnnotationValidator:
         for i, entity in enumerate(entities):
             # Check required entity fields
             if "type" not in entity:
-                self.errors.append(f"Annotation {idx}: Entity {i} missing 'type'")
+                self._error(idx, f"Annotation {idx}: Entity {i} missing 'type'")
                 continue
             
             if "value" not in entity:
-                self.errors.append(f"Annotation {idx}: Entity {i} missing 'value'")
+                self._error(idx, f"Annotation {idx}: Entity {i} missing 'value'")
                 continue
             
             # Validate entity type
@@ -92,8 +122,8 @@ class AnnotationValidator:
                 end = entity["end"]
                 
                 if start < 0 or end > len(transcription):
-                    self.errors.append(
-                        f"Annotation {idx}: Entity position out of bounds ({start}, {end})"
+                    self._error(
+                        idx, f"Annotation {idx}: Entity position out of bounds ({start}, {end})"
                     )
                 
                 # Check if entity value matches transcription
@@ -117,42 +147,74 @@ class AnnotationValidator:
                 )
         return True
     
+    def validate_annotation(self, annotation, idx):
+        """Validate a single annotation."""
+        valid = True
+        
+        if not self.validate_structure(annotation, idx):
+            valid = False
+        
+        if valid:
+            self.validate_intent(annotation, idx)
+            self.validate_entities(annotation, idx)
+            self.validate_quality(annotation, idx)
+        
+        if valid and idx not in self._errored_idx:
+            self.stats["valid"] += 1
+    
+    def _validate_parallel(self, records):
+        """Validate (idx, annotation) records in chunks across a process pool."""
+        chunks = iter(lambda: list(itertools.islice(records, PARALLEL_CHUNK_SIZE)), [])
+        
+        with multiprocessing.Pool() as pool:
+            # imap keeps chunk order, so errors are reported in file order
+            for errors, warnings, stats in pool.imap(_validate_chunk, chunks):
+                self.errors.extend(errors)
+                self.warnings.extend(warnings)
+                self.stats["total"] += stats["total"]
+                self.stats["valid"] += stats["valid"]
+    
     def validate_file(self, filepath):
         """Validate entire annotation file."""
         print(f"🔍 Validating: {filepath}\n")
         
-        # Load annotations
+        # Stream annotations one at a time instead of loading the whole list
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                annotations = json.load(f)
-        except json.JSONDecodeError as e:
+            with open(filepath, 'rb') as f:
+                head = f.read(64).lstrip()
+                f.seek(0)
+                if head and not head.startswith(b'['):
+                    self.errors.append("Annotations should be a list")
+                    return False
+                
+                if IJSON_AVAILABLE:
+                    annotations = ijson.items(f, 'item', use_float=True)
+                elif ORJSON_AVAILABLE:
+                    annotations = orjson.loads(f.read())
+                else:
+                    annotations = json.load(f)
+                
+                records = enumerate(annotations)
+                head = list(itertools.islice(records, PARALLEL_MIN_RECORDS))
+                
+                if len(head) < PARALLEL_MIN_RECORDS or (os.cpu_count() or 1) < 2:
+                    for idx, annotation in itertools.chain(head, records):
+                        self.stats["total"] += 1
+                        self.validate_annotation(annotation, idx)
+                else:
+                    self._validate_parallel(itertools.chain(head, records))
+        except JSON_ERRORS as e:
+            # Discard results from records streamed before the parse failed
+            self.errors.clear()
+            self.warnings.clear()
+            self._errored_idx.clear()
+            self.stats.update(total=0, valid=0)
             self.errors.append(f"Invalid JSON format: {e}")
             return False
         except FileNotFoundError:
             self.errors.append(f"File not found: {filepath}")
             return False
         
-        if not isinstance(annotations, list):
-            self.errors.append("Annotations should be a list")
-            return False
-        
-        self.stats["total"] = len(annotations)
-        
-        # Validate each annotation
-        for idx, annotation in enumerate(annotations):
-            valid = True
-            
-            if not self.validate_structure(annotation, idx):
-                valid = False
-            
-            if valid:
-                self.validate_intent(annotation, idx)
-                self.validate_entities(annotation, idx)
-                self.validate_quality(annotation, idx)
-            
-            if valid and not any(f"Annotation {idx}" in e for e in self.errors):
-                self.stats["valid"] += 1
-        
         self.stats["errors"] = len(self.errors)
         self.stats["warnings"] = len(self.warnings)
         
@@ -191,6 +253,15 @@ class AnnotationValidator:
             print("\n❌ Validation failed. Please fix errors.")
 
 
+def _validate_chunk(records):
+    """Validate a chunk of (idx, annotation) records in a worker process."""
+    validator = AnnotationValidator()
+    for idx, annotation in records:
+        validator.stats["total"] += 1
+        validator.validate_annotation(annotation, idx)
+    return validator.errors, validator.warnings, validator.stats
+
+
 def main():
     parser = argparse.ArgumentParser(description="Validate VAANI annotations")
     parser.add_argument("--input", default="data/annotations/annotations_day2.json",
@@ -10,19 +10,70 @@ Usage:
 import csv
 import json
 import argparse
+import functools
+import heapq
+import importlib.util
 from pathlib import Path
 import re
+import numpy as np
 
+# C implementation of edit distance; falls back to a NumPy DP
+try:
+    from rapidfuzz.distance import Levenshtein
+    from rapidfuzz.process import cpdist
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
+# pandas reads large CSVs in C (multithreaded with pyarrow); falls back to the csv module
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+    CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# Buffer size for CSV reads and writes (fewer, larger syscalls)
+IO_BUFFER_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_text(text):
     """Normalize text for comparison."""
-    # Convert to lowercase
-    text = text.lower()
-    # Remove punctuation
-    text = re.sub(r'[^\w\s]', '', text)
-    # Remove extra whitespace
-    text = ' '.join(text.split())
-    return text
+    # Lowercase, remove punctuation, collapse whitespace
+    # (cached: calculate_wer and calculate_cer normalize the same pair)
+    return ' '.join(_PUNCT_RE.sub('', text.lower()).split())
+
+
+def _edit_distance(ref, hyp):
+    """Levenshtein distance between two sequences (strings or token lists)."""
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.distance(ref, hyp)
+    
+    # NumPy fallback: tokens become int IDs and each DP row is computed vectorized.
+    # Distance is symmetric, so size the rows to the shorter sequence.
+    if len(hyp) > len(ref):
+        ref, hyp = hyp, ref
+    
+    ids = {}
+    ref_ids = np.fromiter((ids.setdefault(t, len(ids)) for t in ref), dtype=np.int32, count=len(ref))
+    hyp_ids = np.fromiter((ids.setdefault(t, len(ids)) for t in hyp), dtype=np.int32, count=len(hyp))
+    
+    offsets = np.arange(len(hyp) + 1, dtype=np.int32)
+    prev = offsets.copy()
+    curr = np.empty_like(offsets)
+    for i, r in enumerate(ref_ids, 1):
+        # Match/substitution and deletion come from the previous row
+        curr[0] = i
+        np.minimum(prev[:-1] + (hyp_ids != r), prev[1:] + 1, out=curr[1:])
+        # Insertions chain along the row: curr[j] = min over k <= j of curr[k] + (j - k)
+        curr -= offsets
+        np.minimum.accumulate(curr, out=curr)
+        curr += offsets
+        prev, curr = curr, prev
+    return int(prev[-1])
 
 
 def calculate_wer(reference, hypothesis):
@@ -35,55 +86,56 @@ def calculate_wer(reference, hypothesis):
     ref_words = normalize_text(reference).split()
     hyp_words = normalize_text(hypothesis).split()
     
-    # Dynamic programming for edit distance
-    d = [[0] * (len(hyp_words) + 1) for _ in range(len(ref_words) + 1)]
-    
-    for i in range(len(ref_words) + 1):
-        d[i][0] = i
-    for j in range(len(hyp_words) + 1):
-        d[0][j] = j
+    if not ref_words:
+        return 0
     
-    for i in range(1, len(ref_words) + 1):
-        for j in range(1, len(hyp_words) + 1):
-            if ref_words[i-1] == hyp_words[j-1]:
-                d[i][j] = d[i-1][j-1]
-            else:
-                substitution = d[i-1][j-1] + 1
-                insertion = d[i][j-1] + 1
-                deletion = d[i-1][j] + 1
-                d[i][j] = min(substitution, insertion, deletion)
-    
-    wer = d[len(ref_words)][len(hyp_words)] / len(ref_words) if ref_words else 0
-    return wer
+    return _edit_distance(ref_words, hyp_words) / len(ref_words)
 
 
 def calculate_cer(reference, hypothesis):
     """
     Calculate Character Error Rate (CER).
     """
-    ref_chars = list(normalize_text(reference).replace(' ', ''))
-    hyp_chars = list(normalize_text(hypothesis).replace(' ', ''))
+    ref_chars = normalize_text(reference).replace(' ', '')
+    hyp_chars = normalize_text(hypothesis).replace(' ', '')
+    
+    if not ref_chars:
+        return 0
+    
+    return _edit_distance(ref_chars, hyp_chars) / len(ref_chars)
+
+
+def _batch_edit_distances(refs, hyps):
+    """Pairwise edit distances between two parallel lists of sequences."""
+    if RAPIDFUZZ_AVAILABLE:
+        # One C call for every pair, spread across all cores
+        return cpdist(refs, hyps, scorer=Levenshtein.distance, workers=-1).tolist()
+    return [_edit_distance(ref, hyp) for ref, hyp in zip(refs, hyps)]
+
+
+def calculate_error_rates(references, hypotheses):
+    """
+    Calculate WER and CER for many reference/hypothesis pairs at once.
     
-    # Dynamic programming for edit distance
-    d = [[0] * (len(hyp_chars) + 1) for _ in range(len(ref_chars) + 1)]
+    Args:
+        references: List of reference transcriptions
+        hypotheses: List of hypothesis transcriptions, parallel to references
     
-    for i in range(len(ref_chars) + 1):
-        d[i][0] = i
-    for j in range(len(hyp_chars) + 1):
-        d[0][j] = j
+    Returns:
+        (wer_scores, cer_scores) lists, one entry per pair
+    """
+    ref_norm = [normalize_text(text) for text in references]
+    hyp_norm = [normalize_text(text) for text in hypotheses]
     
-    for i in range(1, len(ref_chars) + 1):
-        for j in range(1, len(hyp_chars) + 1):
-            if ref_chars[i-1] == hyp_chars[j-1]:
-                d[i][j] = d[i-1][j-1]
-            else:
-                substitution = d[i-1][j-1] + 1
-                insertion = d[i][j-1] + 1
-                deletion = d[i-1][j] + 1
-                d[i][j] = min(substitution, insertion, deletion)
+    ref_words = [text.split() for text in ref_norm]
+    ref_chars = [text.replace(' ', '') for text in ref_norm]
     
-    cer = d[len(ref_chars)][len(hyp_chars)] / len(ref_chars) if ref_chars else 0
-    return cer
+    word_distances = _batch_edit_distances(ref_words, [text.split() for text in hyp_norm])
+    char_distances = _batch_edit_distances(ref_chars, [text.replace(' ', '') for text in hyp_norm])
+    
+    wer_scores = [d / len(ref) if ref else 0 for d, ref in zip(word_distances, ref_words)]
+    cer_scores = [d / len(ref) if ref else 0 for d, ref in zip(char_distances, ref_chars)]
+    return wer_scores, cer_scores
 
 
 def load_ground_truth(filepath):
@@ -103,8 +155,12 @@ def load_ground_truth(filepath):
 
 def load_predictions(filepath):
     """Load ASR predictions."""
+    if PANDAS_AVAILABLE:
+        df = pd.read_csv(filepath, dtype=str, keep_default_na=False, engine=CSV_ENGINE)
+        return dict(zip(df['audio_file'], df['transcription']))
+    
     predictions = {}
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with open(filepath, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
         reader = csv.DictReader(f)
         for row in reader:
             audio_file = row['audio_file']
@@ -123,10 +179,6 @@ def evaluate_asr(ground_truth, predictions, output_file=None):
         predictions: Dict mapping audio_file to hypothesis transcription
         output_file: Optional file to save detailed results
     """
-    results = []
-    wer_scores = []
-    cer_scores = []
-    
     # Find common audio files
     common_files = set(ground_truth.keys()) & set(predictions.keys())
     
@@ -136,23 +188,24 @@ def evaluate_asr(ground_truth, predictions, output_file=None):
     
     print(f"📊 Evaluating {len(common_files)} audio files\n")
     
-    for audio_file in sorted(common_files):
-        reference = ground_truth[audio_file]
-        hypothesis = predictions[audio_file]
-        
-        wer = calculate_wer(reference, hypothesis)
-        cer = calculate_cer(reference, hypothesis)
-        
-        wer_scores.append(wer)
-        cer_scores.append(cer)
-        
-        results.append({
+    audio_files = sorted(common_files)
+    references = [ground_truth[audio_file] for audio_file in audio_files]
+    hypotheses = [predictions[audio_file] for audio_file in audio_files]
+    
+    # Score every file in one batch
+    wer_scores, cer_scores = calculate_error_rates(references, hypotheses)
+    
+    results = [
+        {
             'audio_file': audio_file,
             'reference': reference,
             'hypothesis': hypothesis,
             'wer': wer,
             'cer': cer
-        })
+        }
+        for audio_file, reference, hypothesis, wer, cer
+        in zip(audio_files, references, hypotheses, wer_scores, cer_scores)
+    ]
     
     # Calculate average metrics
     avg_wer = sum(wer_scores) / len(wer_scores) if wer_scores else 0
@@ -167,18 +220,20 @@ def evaluate_asr(ground_truth, predictions, output_file=None):
     print(f"Average WER: {avg_wer:.2%}")
     print(f"Average CER: {avg_cer:.2%}")
     
-    # Show best and worst examples
-    results_sorted = sorted(results, key=lambda x: x['wer'])
+    # Show best and worst examples (partial selection instead of a full sort;
+    # the index breaks WER ties the same way the stable sort did)
+    best = heapq.nsmallest(3, results, key=lambda x: x['wer'])
+    worst = heapq.nlargest(3, enumerate(results), key=lambda x: (x[1]['wer'], x[0]))
     
     print(f"\n✅ Best 3 Examples (Lowest WER):")
-    for r in results_sorted[:3]:
+    for r in best:
         print(f"\n   File: {r['audio_file']}")
         print(f"   REF: {r['reference']}")
         print(f"   HYP: {r['hypothesis']}")
         print(f"   WER: {r['wer']:.2%}, CER: {r['cer']:.2%}")
     
     print(f"\n❌ Worst 3 Examples (Highest WER):")
-    for r in results_sorted[-3:]:
+    for _, r in reversed(worst):
         print(f"\n   File: {r['audio_file']}")
         print(f"   REF: {r['reference']}")
         print(f"   HYP: {r['hypothesis']}")
@@ -186,7 +241,7 @@ def evaluate_asr(ground_truth, predictions, output_file=None):
     
     # Save detailed results
     if output_file:
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
             writer = csv.DictWriter(f, fieldnames=['audio_file', 'reference', 'hypothesis', 'wer', 'cer'])
             writer.writeheader()
             writer.writerows(results)
@@ -0,0 +1,104 @@
+"""
+Fused dialogue turn pipeline.
+
+Runs intent classification, state tracking, decision and response
+generation for one utterance as a single call, threading one Turn
+object through the stages instead of rebuilding intermediate dicts.
+"""
+
+import functools
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Distinct utterances whose classification is kept; voice commands repeat a lot
+CLASSIFY_CACHE_SIZE = 2048
+
+
+class Turn:
+    """Working state for one dialogue turn, filled in by each stage."""
+
+    __slots__ = ('text', 'intent', 'entities', 'confidence', 'state', 'action', 'response')
+
+    def __init__(self, text, state):
+        """
+        Initialize a turn.
+
+        Args:
+            text: User utterance.
+            state: Dialogue state carried over from the previous turn.
+        """
+        self.text = text
+        self.intent = None
+        self.entities = None
+        self.confidence = 0.0
+        self.state = state
+        self.action = None
+        self.response = None
+
+
+class FusedPipeline:
+    """Intent -> state -> decision -> response as one call per turn."""
+
+    def __init__(self, intent_classifier, state_manager, decision_manager, response_generator,
+                 classify_cache_size=CLASSIFY_CACHE_SIZE):
+        """
+        Initialize the pipeline.
+
+        Args:
+            intent_classifier: Object with classify(text).
+            state_manager: Object with update(current_state, intent, entities, user_utterance).
+            decision_manager: Object with decide(intent, entities, state).
+            response_generator: Object with generate(intent, entities, action_result).
+            classify_cache_size: Number of utterances whose classification is cached.
+        """
+        self.classify = functools.lru_cache(maxsize=classify_cache_size)(intent_classifier.classify)
+        self.update_state = state_manager.update
+        self.decide = decision_manager.decide
+        self.generate = response_generator.generate
+
+    def run_turn(self, session, text):
+        """
+        Run all four stages for one utterance.
+
+        The session's 'state' entry is replaced with the updated state.
+
+        Args:
+            session: Session dict holding the dialogue 'state'.
+            text: User utterance.
+
+        Returns:
+            The completed Turn.
+        """
+        turn = Turn(text, session['state'])
+
+        # Repeated utterances reuse the cached classification. The key keeps case
+        # so entity values keep their surface form.
+        classification = self.classify(' '.join(text.split()))
+        turn.intent = classification['intent']
+        turn.entities = dict(classification['entities'])  # the cached dict is shared
+        turn.confidence = classification['confidence']
+
+        logger.info("Classified: intent=%s, confidence=%.2f", turn.intent, turn.confidence)
+
+        turn.state = session['state'] = self.update_state(
+            current_state=turn.state,
+            intent=turn.intent,
+            entities=turn.entities,
+            user_utterance=text
+        )
+
+        turn.action = self.decide(
+            intent=turn.intent,
+            entities=turn.entities,
+            state=turn.state
+        )
+
+        turn.response = self.generate(
+            intent=turn.intent,
+            entities=turn.entities,
+            action_result=turn.action
+        )
+
+        return turn
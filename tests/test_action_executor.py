@@ -0,0 +1,47 @@
+from collections import OrderedDict
+
+import pytest
+
+from pipeline.actions import action_executor
+from pipeline.actions.action_executor import ActionExecutor, get_executor
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(action_executor, "_executor_cache", OrderedDict())
+    monkeypatch.setattr(action_executor, "_default_executor", None)
+
+
+def test_calls_without_config_share_the_default_executor():
+    executor = get_executor()
+
+    assert isinstance(executor, ActionExecutor)
+    assert get_executor(None) is executor
+    assert get_executor({}) is executor
+
+
+def test_same_config_object_reuses_its_executor():
+    config = {"safe_mode": False}
+
+    assert get_executor(config) is get_executor(config)
+    assert get_executor(dict(config)) is not get_executor(config)
+
+
+def test_cache_keeps_only_recently_used_configs(monkeypatch):
+    monkeypatch.setattr(action_executor, "_EXECUTOR_CACHE_SIZE", 2)
+    first, second, third = {"n": 1}, {"n": 2}, {"n": 3}
+
+    first_executor = get_executor(first)
+    get_executor(second)
+    assert get_executor(first) is first_executor  # first is now most recent
+    get_executor(third)
+
+    assert len(action_executor._executor_cache) == 2
+    assert get_executor(first) is first_executor
+    assert id(second) not in action_executor._executor_cache
+
+
+def test_execute_action_from_dm_skips_when_no_action_needed():
+    result = action_executor.execute_action_from_dm({"should_act": False})
+
+    assert result["status"] == "skipped"
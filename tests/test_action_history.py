@@ -0,0 +1,66 @@
+import json
+import threading
+
+from pipeline.actions import action_executor
+
+
+def _lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_flush_writes_pending_entries_in_order(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    pending = action_executor._history_queue(path, 60)
+    pending.extend({"i": i} for i in range(5))
+
+    action_executor._flush_history(path)
+
+    assert _lines(path) == [{"i": i} for i in range(5)]
+    assert not pending
+
+
+def test_concurrent_flushes_keep_every_entry_once(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    pending = action_executor._history_queue(path, 0.001)
+
+    def produce():
+        for i in range(2000):
+            pending.append({"i": i})
+
+    def flush():
+        for _ in range(200):
+            action_executor._flush_history(path)
+
+    threads = [threading.Thread(target=produce) for _ in range(3)]
+    threads += [threading.Thread(target=flush) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    action_executor._flush_history(path)
+
+    assert len(_lines(path)) == 6000
+
+
+def test_failed_write_keeps_entries_for_next_flush(tmp_path, caplog):
+    path = str(tmp_path / "missing" / "history.jsonl")
+    pending = action_executor._history_queue(path, 60)
+    pending.extend([{"i": 0}, {"i": 1}])
+
+    action_executor._flush_history(path)
+
+    assert list(pending) == [{"i": 0}, {"i": 1}]
+    assert "Failed to persist 2 action history entries" in caplog.text
+
+    (tmp_path / "missing").mkdir()
+    action_executor._flush_history(path)
+    assert _lines(path) == [{"i": 0}, {"i": 1}]
+
+
+def test_executors_on_one_path_share_a_queue(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    first = action_executor.ActionExecutor({"action_history_path": path, "action_history_flush_interval": 60})
+    second = action_executor.ActionExecutor({"action_history_path": path, "action_history_flush_interval": 60})
+
+    assert first._pending_history is second._pending_history
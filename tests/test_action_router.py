@@ -0,0 +1,66 @@
+import sys
+from types import MappingProxyType
+
+import pytest
+
+from pipeline.actions import registry
+from pipeline.actions.action_router import ActionRouter
+
+LAZY_MODULE = "vaani_test_lazy_action"
+
+LAZY_SOURCE = '''
+from pipeline.actions.registry import register_action
+
+calls = []
+
+@register_action("TEST_LAZY")
+def lazy_action(entities, context):
+    calls.append(entities)
+    return {"status": "success", "message": "ran", "data": {}}
+'''
+
+
+@pytest.fixture
+def router(tmp_path, monkeypatch):
+    (tmp_path / f"{LAZY_MODULE}.py").write_text(LAZY_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, LAZY_MODULE, raising=False)
+    monkeypatch.setattr(registry, "_REGISTRY", dict(registry._REGISTRY))
+    monkeypatch.setattr(ActionRouter, "_CLASS_ACTION_MAP", MappingProxyType({
+        "TEST_LAZY": LAZY_MODULE,
+        "TEST_BROKEN": "vaani_test_missing_module",
+    }))
+    yield ActionRouter()
+    sys.modules.pop(LAZY_MODULE, None)
+
+
+def test_action_module_is_imported_on_first_dispatch(router):
+    assert LAZY_MODULE not in sys.modules
+
+    result = router.route("TEST_LAZY", {"n": 1})
+
+    assert result["status"] == "success"
+    assert LAZY_MODULE in sys.modules
+
+
+def test_resolved_action_is_reused(router, monkeypatch):
+    router.route("TEST_LAZY", {"n": 1})
+    monkeypatch.setattr(router, "_resolve", lambda *args: pytest.fail("resolved twice"))
+
+    router.route("TEST_LAZY", {"n": 2})
+    router.route_by_id(router.intent_ids["TEST_LAZY"], {"n": 3})
+
+    assert sys.modules[LAZY_MODULE].calls == [{"n": 1}, {"n": 2}, {"n": 3}]
+
+
+def test_unknown_intent_is_an_error_result(router):
+    result = router.route("NOT_AN_INTENT", {})
+
+    assert result["status"] == "error"
+    assert result["data"] == {"intent": "NOT_AN_INTENT"}
+
+
+def test_module_that_fails_to_import_is_an_error_result(router):
+    result = router.route("TEST_BROKEN", {})
+
+    assert result["status"] == "error"
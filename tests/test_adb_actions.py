@@ -0,0 +1,129 @@
+import subprocess
+
+import pytest
+
+from pipeline.android_bridge import adb_actions
+from pipeline.android_bridge.adb_actions import ADBActions
+
+LONG_TEXT = "this sentence is long enough to go through the clipboard"
+
+
+class FakeShell:
+    """Records shell commands and answers them from a prefix -> output table."""
+
+    def __init__(self, replies=None):
+        self.replies = replies or {}
+        self.commands = []
+
+    def __call__(self, command):
+        self.commands.append(command)
+        for prefix, output in self.replies.items():
+            if command.startswith(prefix):
+                return output
+        return ""
+
+
+@pytest.fixture
+def pushes(monkeypatch):
+    calls = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(argv)
+        return subprocess.CompletedProcess(argv, 0)
+
+    monkeypatch.setattr(adb_actions.subprocess, "run", fake_run)
+    return calls
+
+
+def _actions(shell):
+    actions = ADBActions("DEVICE", use_persistent=False)
+    actions._shell = shell
+    actions.last_exit_code = 0
+    return actions
+
+
+def test_long_text_without_clipboard_helper_types_directly(pushes):
+    shell = FakeShell({"getprop": "28\n"})
+    actions = _actions(shell)
+
+    actions.type_text(LONG_TEXT)
+    actions.type_text(LONG_TEXT)
+
+    assert not pushes
+    assert sum(c.startswith("getprop") for c in shell.commands) == 1
+    assert sum(c.startswith("input text") for c in shell.commands) == 2
+
+
+def test_long_text_uses_clipper_when_installed(pushes):
+    shell = FakeShell({
+        "getprop": "28\npackage:ca.zgrs.clipper\n",
+        "am broadcast": "Broadcast completed: result=-1",
+    })
+    actions = _actions(shell)
+
+    assert actions.type_text(LONG_TEXT)["status"] == "success"
+    assert len(pushes) == 1
+    assert shell.commands[-1] == "input keyevent 279"
+
+
+def test_long_text_uses_cmd_clipboard_on_api_29(pushes):
+    shell = FakeShell({"getprop": "33\n"})
+    actions = _actions(shell)
+
+    actions.type_text(LONG_TEXT)
+
+    assert any(c.startswith("cmd clipboard set-text") for c in shell.commands)
+    assert shell.commands[-1] == "input keyevent 279"
+
+
+def test_failed_clipboard_helper_is_not_retried(pushes, caplog):
+    shell = FakeShell({
+        "getprop": "28\npackage:ca.zgrs.clipper\n",
+        "am broadcast": "Broadcast completed: result=0",
+    })
+    actions = _actions(shell)
+
+    actions.type_text(LONG_TEXT)
+    actions.type_text(LONG_TEXT)
+
+    assert len(pushes) == 1
+    assert "Clipboard via clipper failed" in caplog.text
+    assert sum(c.startswith("input text") for c in shell.commands) == 2
+
+
+def test_send_sms_skips_the_tap_when_the_messaging_app_fails_to_open():
+    shell = FakeShell({"am start -W": "Starting: Intent { }\nError: Activity not started\n"})
+    actions = _actions(shell)
+
+    result = actions.send_sms("5551234", "hello")
+
+    assert result["status"] == "error"
+    assert not any(c.startswith("input tap") for c in shell.commands)
+
+
+def test_send_sms_taps_send_once_the_launch_is_reported():
+    shell = FakeShell({
+        "am start -W": "Starting: Intent { }\nStatus: ok\nLaunchState: COLD\n",
+        "wm size": "Physical size: 1080x2400\n",
+    })
+    actions = _actions(shell)
+
+    result = actions.send_sms("5551234", "hello")
+
+    assert result["status"] == "success"
+    assert [c.split()[0:2] for c in shell.commands] == [
+        ["am", "start"], ["wm", "size"], ["input", "tap"],
+    ]
+    assert shell.commands[-1] == "input tap 980 2300"
+
+
+def test_open_app_fallback_reports_a_failed_launch():
+    shell = FakeShell({
+        "am start -W": "Error type 3\nError: Activity class does not exist.\n",
+    })
+    actions = _actions(shell)
+
+    result = actions.open_app("com.example.missing")
+
+    assert result == {"status": "error", "message": "Could not launch com.example.missing"}
+    assert sum(c.startswith("am start -W") for c in shell.commands) == 1
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from pipeline.asr import asr_evaluate
+
+
+def reference_distance(ref, hyp):
+    """Textbook Levenshtein DP, the ground truth for the fast paths."""
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        curr = [i]
+        for j, h in enumerate(hyp, 1):
+            curr.append(min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (r != h)))
+        prev = curr
+    return prev[-1]
+
+
+def _random_pairs(seed, count=200):
+    rng = random.Random(seed)
+    alphabet = "abcde"
+    words = ["turn", "on", "the", "lights", "off", "play", "music"]
+    pairs = [("", ""), ("abc", ""), ("", "abc"), (["on"], []), ("kitten", "sitting")]
+    for _ in range(count):
+        if rng.random() < 0.5:
+            pairs.append((
+                "".join(rng.choices(alphabet, k=rng.randint(0, 30))),
+                "".join(rng.choices(alphabet, k=rng.randint(0, 30))),
+            ))
+        else:
+            pairs.append((
+                rng.choices(words, k=rng.randint(0, 12)),
+                rng.choices(words, k=rng.randint(0, 12)),
+            ))
+    return pairs
+
+
+@pytest.fixture
+def numpy_fallback(monkeypatch):
+    monkeypatch.setattr(asr_evaluate, "RAPIDFUZZ_AVAILABLE", False)
+
+
+def test_numpy_fallback_matches_reference(numpy_fallback):
+    for ref, hyp in _random_pairs(seed=7):
+        assert asr_evaluate._edit_distance(ref, hyp) == reference_distance(ref, hyp), (ref, hyp)
+
+
+def test_batch_fallback_matches_pairwise(numpy_fallback):
+    pairs = _random_pairs(seed=11, count=50)
+    refs, hyps = [p[0] for p in pairs], [p[1] for p in pairs]
+
+    assert asr_evaluate._batch_edit_distances(refs, hyps) == [reference_distance(r, h) for r, h in pairs]
+
+
+@pytest.mark.skipif(not asr_evaluate.RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
+def test_rapidfuzz_path_matches_reference():
+    for ref, hyp in _random_pairs(seed=3):
+        assert asr_evaluate._edit_distance(ref, hyp) == reference_distance(ref, hyp), (ref, hyp)
+
+
+def test_error_rates_for_known_pair(numpy_fallback):
+    wer, cer = asr_evaluate.calculate_error_rates(["Turn on the lights"], ["turn off the light"])
+
+    assert wer == [pytest.approx(2 / 4)]
+    assert cer == [pytest.approx(3 / 15)]
+    assert asr_evaluate.calculate_wer("", "anything") == 0
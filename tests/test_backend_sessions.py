@@ -0,0 +1,132 @@
+import asyncio
+import importlib
+import json
+import sys
+import time
+import types
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+SERVER_MODULE = "pipeline.android_bridge.vaani_backend_server"
+
+# The NLU stages load trained models; the session tests only need their call shapes
+STAGE_DOUBLES = {
+    "pipeline.nlu.intent_classifier": "IntentClassifier",
+    "pipeline.dst.state_manager": "StateManager",
+    "pipeline.dm.decision_manager": "DecisionManager",
+    "pipeline.nlg.response_generator": "ResponseGenerator",
+}
+
+
+class IntentClassifier:
+    delay = 0.0
+
+    def classify(self, text):
+        time.sleep(self.delay)
+        return {"intent": "ECHO", "entities": {}, "confidence": 1.0}
+
+
+class StateManager:
+    def update(self, current_state, intent, entities, user_utterance):
+        return {"turns": current_state.get("turns", 0) + 1, "last": user_utterance}
+
+
+class DecisionManager:
+    def decide(self, intent, entities, state):
+        return {"should_act": False}
+
+
+class ResponseGenerator:
+    def generate(self, intent, entities, action_result):
+        return "ok"
+
+
+class FakeRequest:
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+
+    async def read(self):
+        return self._body
+
+    async def json(self):
+        return json.loads(self._body)
+
+
+@pytest.fixture
+def server_module(monkeypatch):
+    for name, class_name in STAGE_DOUBLES.items():
+        module = types.ModuleType(name)
+        setattr(module, class_name, globals()[class_name])
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.delitem(sys.modules, SERVER_MODULE, raising=False)
+    module = importlib.import_module(SERVER_MODULE)
+    yield module
+    sys.modules.pop(SERVER_MODULE, None)
+
+
+@pytest.fixture
+def server(server_module):
+    server = server_module.VaaniBackendServer()
+    yield server
+    server.executor.shutdown(wait=True)
+
+
+def test_least_recently_active_session_is_evicted(server, server_module, monkeypatch):
+    monkeypatch.setattr(server_module, "MAX_SESSIONS", 2)
+
+    server._get_session("a")
+    server._get_session("b")
+    server._get_session("a")
+    server._get_session("c")
+
+    assert list(server.sessions) == ["a", "c"]
+
+
+def test_sweep_drops_only_idle_sessions(server, server_module, monkeypatch):
+    monkeypatch.setattr(server_module, "SESSION_SWEEP_INTERVAL", 0.01)
+    monkeypatch.setattr(server_module, "SESSION_IDLE_TIMEOUT", 60)
+    for device_id in ("old", "older", "fresh"):
+        server._get_session(device_id)
+    server.sessions["old"]["last_active"] -= 120
+    server.sessions["older"]["last_active"] -= 120
+    server.sessions.move_to_end("fresh")
+
+    async def run_sweep():
+        await server._start_session_sweeper(server.app)
+        await asyncio.sleep(0.05)
+        await server._stop_session_sweeper(server.app)
+
+    asyncio.run(run_sweep())
+
+    assert list(server.sessions) == ["fresh"]
+
+
+def _process(server, device_id, text):
+    return server.process_command(FakeRequest({"device_id": device_id, "text": text}))
+
+
+def test_turns_for_one_device_run_in_order(server, monkeypatch):
+    monkeypatch.setattr(IntentClassifier, "delay", 0.05)
+
+    async def burst():
+        return await asyncio.gather(*(_process(server, "phone", f"turn {i}") for i in range(4)))
+
+    responses = asyncio.run(burst())
+
+    states = [json.loads(r.body)["state"] for r in responses]
+    assert [s["turns"] for s in states] == [1, 2, 3, 4]
+    assert [t["text"] for t in server.sessions["phone"]["history"]] == [f"turn {i}" for i in range(4)]
+
+
+def test_turns_for_different_devices_run_in_parallel(server, monkeypatch):
+    monkeypatch.setattr(IntentClassifier, "delay", 0.2)
+
+    async def burst():
+        started = time.monotonic()
+        await asyncio.gather(*(_process(server, f"phone-{i}", f"hello {i}") for i in range(4)))
+        return time.monotonic() - started
+
+    assert asyncio.run(burst()) < 0.6
+    assert all(s["state"]["turns"] == 1 for s in server.sessions.values())
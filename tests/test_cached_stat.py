@@ -0,0 +1,32 @@
+import os
+
+from pipeline.actions import modules
+
+
+def test_cached_stat_reports_hits_and_misses(tmp_path):
+    present = tmp_path / "present.txt"
+    present.write_text("x")
+
+    assert modules.cached_stat(str(present)).st_size == 1
+    assert modules.cached_stat(str(tmp_path / "absent.txt")) is None
+
+
+def test_cached_stat_reuses_result_within_ttl(tmp_path, monkeypatch):
+    path = str(tmp_path / "late.txt")
+    assert modules.cached_stat(path) is None
+
+    (tmp_path / "late.txt").write_text("x")
+    assert modules.cached_stat(path) is None
+
+    monkeypatch.setattr(modules, "_STAT_TTL", 0.0)
+    assert modules.cached_stat(path) is not None
+
+
+def test_cached_stat_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(modules, "_STAT_CACHE_SIZE", 4)
+    monkeypatch.setattr(modules, "_stat_cache", type(modules._stat_cache)())
+
+    for i in range(10):
+        modules.cached_stat(os.path.join(str(tmp_path), f"f{i}"))
+
+    assert list(modules._stat_cache) == [os.path.join(str(tmp_path), f"f{i}") for i in range(6, 10)]
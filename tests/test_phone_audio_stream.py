@@ -0,0 +1,72 @@
+import os
+import socket
+import stat
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from pipeline.android_bridge.phone_audio_stream import PhoneAudioStream
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="uses a shell script as a fake adb")
+
+
+@pytest.fixture
+def fake_adb(tmp_path):
+    script = tmp_path / "adb"
+    script.write_text("#!/bin/sh\nexit 0\n")
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    return str(script)
+
+
+@pytest.fixture
+def phone():
+    """Local listener standing in for the phone's mic service."""
+    server = socket.socket()
+    server.bind(("localhost", 0))
+    server.listen()
+    connections = []
+
+    def accept():
+        conn, _ = server.accept()
+        connections.append(conn)
+        conn.sendall(b"\x00\x10" * 1024)
+
+    threading.Thread(target=accept, daemon=True).start()
+    yield server.getsockname()[1]
+    for conn in connections:
+        conn.close()
+    server.close()
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_forward_process_is_reaped_once_connected(fake_adb, phone):
+    stream = PhoneAudioStream("DEVICE", adb_path=fake_adb, port=phone, energy_threshold=0)
+
+    assert stream.start()
+    assert _wait_until(lambda: len(stream.audio_queue) > 0)
+    assert stream._forward_proc is None
+    stream.stop()
+
+
+def test_stop_reaps_a_hung_forward_process():
+    stream = PhoneAudioStream("DEVICE")
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    stream._forward_proc = proc
+
+    started = time.monotonic()
+    stream.stop()
+
+    assert time.monotonic() - started < 5
+    assert proc.returncode is not None
+    assert stream._forward_proc is None
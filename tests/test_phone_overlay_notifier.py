@@ -0,0 +1,76 @@
+import socket
+import threading
+import time
+
+from pipeline.android_bridge import phone_overlay_notifier
+from pipeline.android_bridge.phone_overlay_notifier import OverlayState, PhoneOverlayNotifier
+
+
+class SlowSocket:
+    """Socket stand-in whose sendall blocks until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.sent = []
+
+    def sendall(self, data):
+        self.release.wait(5)
+        self.sent.append(bytes(data))
+
+    def close(self):
+        pass
+
+
+def _connected(sock):
+    notifier = PhoneOverlayNotifier("DEVICE")
+    notifier.socket = sock
+    notifier.connected = True
+    return notifier
+
+
+def _wait_for_flush():
+    time.sleep(phone_overlay_notifier._COALESCE_WINDOW * 20)
+
+
+def test_burst_of_states_goes_out_as_one_write():
+    ours, theirs = socket.socketpair()
+    notifier = _connected(ours)
+
+    assert notifier.send_state(OverlayState.LISTENING)
+    assert notifier.send_state(OverlayState.PROCESSING)
+    assert notifier.send_state(OverlayState.SPEAKING)
+    _wait_for_flush()
+
+    theirs.settimeout(1)
+    assert theirs.recv(1024) == b"LISTENING\nPROCESSING\nSPEAKING\n"
+    notifier.disconnect()
+    theirs.close()
+
+
+def test_slow_socket_does_not_block_send_state():
+    sock = SlowSocket()
+    notifier = _connected(sock)
+
+    notifier.send_state(OverlayState.LISTENING)
+    _wait_for_flush()  # the flush is now stuck in sendall
+
+    started = time.monotonic()
+    for _ in range(10):
+        notifier.send_state(OverlayState.PROCESSING)
+    assert time.monotonic() - started < 0.5
+
+    sock.release.set()
+    _wait_for_flush()
+    notifier._flush()
+    assert sock.sent[0] == b"LISTENING\n"
+    assert b"".join(sock.sent[1:]) == b"PROCESSING\n" * 10
+
+
+def test_send_state_without_overlay_reports_not_queued(monkeypatch):
+    notifier = PhoneOverlayNotifier("DEVICE")
+    attempts = []
+    monkeypatch.setattr(notifier, "connect", lambda: attempts.append(1) or False)
+
+    assert notifier.send_state(OverlayState.IDLE) is False
+    assert notifier.send_state(OverlayState.IDLE) is False
+    assert len(attempts) == 1  # reconnects are rate-limited
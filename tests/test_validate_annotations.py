@@ -0,0 +1,164 @@
+import json
+
+import pytest
+
+from pipeline.annotation import validate_annotations
+from pipeline.annotation.validate_annotations import AnnotationValidator
+
+
+def _annotation(i, intent="GREETING", entities=None, quality=4):
+    return {
+        "id": f"a{i}",
+        "audio_file": f"a{i}.wav",
+        "transcription": "call mom at 7 AM",
+        "intent": intent,
+        "entities": entities if entities is not None else [
+            {"type": "PERSON", "value": "mom", "start": 5, "end": 8},
+        ],
+        "metadata": {"annotator": "t", "annotation_date": "2026-01-01", "quality_score": quality},
+    }
+
+
+def _mixed_annotations(count):
+    records = []
+    for i in range(count):
+        kind = i % 5
+        if kind == 1:
+            records.append(_annotation(i, intent="NOT_AN_INTENT"))
+        elif kind == 2:
+            records.append(_annotation(i, entities=[{"type": "PERSON", "value": "dad", "start": 5, "end": 8}]))
+        elif kind == 3:
+            record = _annotation(i)
+            del record["audio_file"]
+            records.append(record)
+        else:
+            records.append(_annotation(i))
+    return records
+
+
+def _write(tmp_path, data, name="annotations.json"):
+    path = tmp_path / name
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def _run(path):
+    validator = AnnotationValidator()
+    ok = validator.validate_file(path)
+    return ok, validator.errors, validator.warnings, validator.stats
+
+
+@pytest.fixture(params=["ijson", "orjson", "json"])
+def parser(request, monkeypatch):
+    """Run a test once per available JSON parser."""
+    if request.param == "ijson":
+        if not validate_annotations.IJSON_AVAILABLE:
+            pytest.skip("ijson not installed")
+    else:
+        monkeypatch.setattr(validate_annotations, "IJSON_AVAILABLE", False)
+    if request.param == "orjson":
+        if not validate_annotations.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(validate_annotations, "ORJSON_AVAILABLE", False)
+    return request.param
+
+
+def test_valid_file_passes(tmp_path, parser):
+    ok, errors, warnings, stats = _run(_write(tmp_path, [_annotation(i) for i in range(3)]))
+
+    assert ok
+    assert errors == [] and warnings == []
+    assert stats["total"] == stats["valid"] == 3
+
+
+def test_errors_and_warnings_are_reported_in_file_order(tmp_path, parser):
+    ok, errors, warnings, stats = _run(_write(tmp_path, _mixed_annotations(10)))
+
+    assert not ok
+    assert errors == [
+        "Annotation 1 (a1): Invalid intent 'NOT_AN_INTENT'",
+        "Annotation 3: Missing required field 'audio_file'",
+        "Annotation 6 (a6): Invalid intent 'NOT_AN_INTENT'",
+        "Annotation 8: Missing required field 'audio_file'",
+    ]
+    assert len(warnings) == 2  # entity values that do not match the transcription
+    assert stats["total"] == 10 and stats["valid"] == 6
+
+
+def test_invalid_json_discards_partial_results(tmp_path, parser):
+    path = tmp_path / "broken.json"
+    path.write_text(json.dumps(_mixed_annotations(4))[:-20])
+
+    ok, errors, warnings, stats = _run(str(path))
+
+    assert not ok
+    assert len(errors) == 1 and errors[0].startswith("Invalid JSON format")
+    assert warnings == []
+    assert stats["total"] == 0
+
+
+def test_top_level_object_is_rejected(tmp_path, parser):
+    ok, errors, _, _ = _run(_write(tmp_path, {"id": "a0"}))
+
+    assert not ok
+    assert errors == ["Annotations should be a list"]
+
+
+def test_missing_file_is_reported(tmp_path):
+    ok, errors, _, _ = _run(str(tmp_path / "absent.json"))
+
+    assert not ok
+    assert errors[0].startswith("File not found")
+
+
+def test_process_pool_matches_sequential_validation(tmp_path, monkeypatch):
+    path = _write(tmp_path, _mixed_annotations(40))
+    sequential = _run(path)
+
+    monkeypatch.setattr(validate_annotations, "PARALLEL_MIN_RECORDS", 10)
+    monkeypatch.setattr(validate_annotations, "PARALLEL_CHUNK_SIZE", 7)
+    monkeypatch.setattr(validate_annotations.os, "cpu_count", lambda: 4)
+    pool_chunks = []
+
+    class InlinePool:
+        """Pool stand-in that records the chunks it is given."""
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def imap(self, func, chunks):
+            for chunk in chunks:
+                pool_chunks.append(len(chunk))
+                yield func(chunk)
+
+    monkeypatch.setattr(validate_annotations.multiprocessing, "Pool", InlinePool)
+    parallel = _run(path)
+
+    assert pool_chunks == [7, 7, 7, 7, 7, 5]
+    assert parallel == sequential
+
+
+def test_real_process_pool_matches_sequential_validation(tmp_path, monkeypatch):
+    path = _write(tmp_path, _mixed_annotations(30))
+    sequential = _run(path)
+
+    monkeypatch.setattr(validate_annotations, "PARALLEL_MIN_RECORDS", 10)
+    monkeypatch.setattr(validate_annotations, "PARALLEL_CHUNK_SIZE", 4)
+    monkeypatch.setattr(validate_annotations.os, "cpu_count", lambda: 2)
+
+    assert _run(path) == sequential
+
+
+def test_small_files_skip_the_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(validate_annotations.multiprocessing, "Pool", lambda *a, **k: pytest.fail("pool used"))
+
+    ok, _, _, stats = _run(_write(tmp_path, [_annotation(i) for i in range(5)]))
+
+    assert ok and stats["total"] == 5
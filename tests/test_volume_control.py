@@ -0,0 +1,118 @@
+import importlib
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from pipeline.actions import registry
+
+MODULE = "pipeline.actions.modules.volume_control_action"
+
+
+class FakeCOMError(Exception):
+    pass
+
+
+class FakeEndpointVolume:
+    """Endpoint volume that only accepts calls from the COM worker thread."""
+
+    def __init__(self, level=0.5):
+        self.level = level
+
+    def _check_thread(self):
+        assert threading.current_thread().name == "volume-com"
+
+    def GetMasterVolumeLevelScalar(self):
+        self._check_thread()
+        return self.level
+
+    def SetMasterVolumeLevelScalar(self, level, context):
+        self._check_thread()
+        self.level = level
+
+
+@pytest.fixture
+def volume(monkeypatch):
+    endpoint = FakeEndpointVolume()
+    com_inits = []
+
+    comtypes = types.ModuleType("comtypes")
+    comtypes.CLSCTX_ALL = 0
+    comtypes.COMError = FakeCOMError
+    comtypes.CoInitialize = lambda: com_inits.append(threading.current_thread().name)
+
+    pycaw = types.ModuleType("pycaw.pycaw")
+    speakers = types.SimpleNamespace(Activate=lambda *args: endpoint)
+    pycaw.AudioUtilities = types.SimpleNamespace(GetSpeakers=lambda: speakers)
+    pycaw.IAudioEndpointVolume = types.SimpleNamespace(_iid_=None)
+
+    monkeypatch.setitem(sys.modules, "comtypes", comtypes)
+    monkeypatch.setitem(sys.modules, "pycaw", types.ModuleType("pycaw"))
+    monkeypatch.setitem(sys.modules, "pycaw.pycaw", pycaw)
+    monkeypatch.setattr(registry, "_REGISTRY", dict(registry._REGISTRY))
+    monkeypatch.delitem(sys.modules, MODULE, raising=False)
+
+    module = importlib.import_module(MODULE)
+    monkeypatch.setattr(module, "cast", lambda interface, kind: interface)
+    monkeypatch.setattr(module, "POINTER", lambda kind: kind)
+    monkeypatch.setattr(module, "_COALESCE_WINDOW", 0.05)
+    module.endpoint = endpoint
+    module.com_inits = com_inits
+    yield module
+    module._cancel_pending()
+    sys.modules.pop(MODULE, None)
+
+
+def _wait_for_flush(module):
+    time.sleep(module._COALESCE_WINDOW * 4)
+
+
+def test_steps_coalesce_and_report_target(volume):
+    results = [volume.change_volume("up", {}, {}) for _ in range(3)]
+
+    assert [r["data"]["volume"] for r in results] == [60, 70, 80]
+    _wait_for_flush(volume)
+    assert volume.endpoint.level == pytest.approx(0.8)
+
+
+def test_all_com_calls_run_on_one_initialised_thread(volume):
+    volume.change_volume("down", {}, {})
+    _wait_for_flush(volume)
+    volume.change_volume("set", {"level": 30}, {})
+
+    assert volume.com_inits == ["volume-com"]
+
+
+def test_set_rounds_reported_level(volume):
+    result = volume.change_volume("set", {"level": 29}, {})
+
+    assert result["data"]["volume"] == 29
+    assert result["message"] == "Volume set to 29%"
+
+
+def test_failed_flush_is_reported_by_next_call(volume, monkeypatch):
+    def fail(level, context):
+        raise FakeCOMError("device gone")
+
+    volume.change_volume("up", {}, {})
+    monkeypatch.setattr(volume.endpoint, "SetMasterVolumeLevelScalar", fail)
+    _wait_for_flush(volume)
+
+    result = volume.change_volume("up", {}, {})
+    assert result["status"] == "error"
+    assert "device gone" in result["message"]
+
+
+def test_hung_worker_times_out(volume, monkeypatch):
+    monkeypatch.setattr(volume, "_WORKER_TIMEOUT", 0.1)
+    release = threading.Event()
+    volume._submit(lambda endpoint: release.wait(5))
+
+    try:
+        result = volume.change_volume("set", {"level": 40}, {})
+    finally:
+        release.set()
+
+    assert result == {"status": "error", "message": "Volume control did not respond", "data": {}}